@@ -14,12 +14,12 @@ def run_gh_command(args):
         result = subprocess.run(
             ['gh'] + args,
             capture_output=True,
-            text=True,
             check=True
         )
+        # Raw bytes: JSON output goes straight to the parser undecoded
         return result.stdout, None
     except subprocess.CalledProcessError as e:
-        return None, e.stderr
+        return None, e.stderr.decode(errors='replace')
     except FileNotFoundError:
         return None, "gh CLI not found. Please install GitHub CLI."
 
@@ -33,11 +33,49 @@ def test_auth():
         return False
     
     print("✅ Authentication successful")
-    print(output)
+    print(output.decode(errors='replace'))
     return True
 
+def build_diagnostic_query(repo=None):
+    """Build one GraphQL document covering every diagnostic check."""
+    fields = ["viewer { login }"]
+    if repo:
+        fields.append(
+            "repository(owner: $owner, name: $name) { name issues(states: OPEN) { totalCount } }"
+        )
+        return "query($owner: String!, $name: String!) { " + " ".join(fields) + " }"
+    return "query { " + " ".join(fields) + " }"
+
+def run_diagnostic_query(repo=None):
+    """Run the GraphQL and repository checks as a single request.
+
+    Returns the parsed response (which may carry both ``data`` and
+    ``errors``) and an error message if nothing could be parsed.
+    """
+    args = ['gh', 'api', 'graphql', '-f', f'query={build_diagnostic_query(repo)}']
+    if repo:
+        owner, _, name = repo.partition('/')
+        args += ['-f', f'owner={owner}', '-f', f'name={name}']
+    
+    try:
+        # gh exits non-zero when the response has errors (e.g. an unknown
+        # repository) but still prints the partial result
+        result = subprocess.run(args, capture_output=True)
+    except FileNotFoundError:
+        return None, "gh CLI not found. Please install GitHub CLI."
+    
+    try:
+        return json.loads(result.stdout), None
+    except json.JSONDecodeError:
+        return None, result.stderr.decode(errors='replace') or "Failed to parse GraphQL response"
+
 def test_rate_limit():
-    """Check current rate limit status."""
+    """Check current rate limit status.
+
+    The REST endpoint reports every budget (core covers the REST and ETag
+    fetches, and is all unauthenticated runs get) and does not count
+    against any of them.
+    """
     print("\n📊 Checking rate limits...")
     output, error = run_gh_command(['api', 'rate_limit'])
     
@@ -61,52 +99,40 @@ def test_rate_limit():
                 reset_time = datetime.fromtimestamp(resource['reset'])
                 print(f"⚠️  {name} API rate limit is low! Resets at {reset_time}")
                 
-    except json.JSONDecodeError:
+    except (json.JSONDecodeError, KeyError):
         print("❌ Failed to parse rate limit response")
 
-def test_repo_access(repo):
+def test_repo_access(repo, response):
     """Test access to a specific repository."""
     print(f"\n🔍 Testing access to {repo}...")
     
-    # Test basic repo access
-    output, error = run_gh_command(['api', f'repos/{repo}', '--jq', '.name'])
-    
-    if error:
-        if "404" in error:
+    repository = ((response or {}).get('data') or {}).get('repository')
+    if not repository:
+        errors = (response or {}).get('errors') or []
+        if any(error.get('type') == 'NOT_FOUND' for error in errors):
             print(f"❌ Repository not found or no access: {repo}")
         else:
-            print(f"❌ Failed to access repository: {error}")
+            print(f"❌ Failed to access repository: {errors}")
         return False
     
-    print(f"✅ Can access repository: {output.strip()}")
-    
-    # Test issues access
-    output, error = run_gh_command(['api', f'repos/{repo}/issues', '--jq', 'length'])
-    
-    if error:
-        print(f"⚠️  Cannot list issues: {error}")
-    else:
-        print(f"✅ Can list issues (found {output.strip()} open issues)")
+    print(f"✅ Can access repository: {repository['name']}")
+    print(f"✅ Can list issues (found {repository['issues']['totalCount']} open issues)")
     
     return True
 
-def test_graphql():
+def test_graphql(response, error):
     """Test GraphQL API access."""
     print("\n🔮 Testing GraphQL API...")
     
-    query = '{ viewer { login } }'
-    output, error = run_gh_command(['api', 'graphql', '-f', f'query={query}'])
-    
     if error:
         print(f"❌ GraphQL API failed: {error}")
         return False
     
     try:
-        data = json.loads(output)
-        login = data['data']['viewer']['login']
+        login = response['data']['viewer']['login']
         print(f"✅ GraphQL API working (logged in as {login})")
         return True
-    except (json.JSONDecodeError, KeyError):
+    except (KeyError, TypeError):
         print("❌ Failed to parse GraphQL response")
         return False
 
@@ -122,13 +148,16 @@ def main():
     # Check rate limits
     test_rate_limit()
     
+    # GraphQL access and repo access both come from one query
+    repo = sys.argv[1] if len(sys.argv) > 1 else None
+    response, error = run_diagnostic_query(repo)
+    
     # Test GraphQL
-    test_graphql()
+    test_graphql(response, error)
     
     # Test specific repo if provided
-    if len(sys.argv) > 1:
-        repo = sys.argv[1]
-        test_repo_access(repo)
+    if repo:
+        test_repo_access(repo, response)
     else:
         print("\n💡 Tip: Run with a repo name to test specific access")
         print("   Example: python test-github-api.py owner/repo")
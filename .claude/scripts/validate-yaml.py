@@ -7,9 +7,21 @@ Checks for common corruption patterns and fixes them.
 import yaml
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import re
 
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Corruption patterns, compiled once for the whole templates directory
+# Matches enum reprs like <IssueStatus.TODO: 'todo'>, capturing the value
+ENUM_PATTERN = re.compile(r'<\w+\.(\w+):\s*[\'"]?(\w+)[\'"]?>')
+PYTHON_OBJECT_PATTERN = re.compile(r'!!python/object[^\n]*\n\s*-\s*')
+
 def check_yaml_file(filepath):
     """Check a YAML file for common issues."""
     issues = []
@@ -22,13 +34,12 @@ def check_yaml_file(filepath):
         issues.append("Contains Python type annotations (!!python/object)")
     
     # Check for enum representations
-    enum_pattern = r'<\w+\.\w+:\s*[\'"]?\w+[\'"]?>'
-    if re.search(enum_pattern, content):
+    if ENUM_PATTERN.search(content):
         issues.append("Contains enum object representations")
     
     # Try to parse the YAML
     try:
-        data = yaml.safe_load(content)
+        data = yaml.load(content, Loader=SafeLoader)
         
         # Check for required fields
         if not isinstance(data, dict):
@@ -58,11 +69,11 @@ def fix_yaml_file(filepath):
     original_content = content
     
     # Remove Python type annotations
-    content = re.sub(r'!!python/object[^\n]*\n\s*-\s*', '', content)
+    content = PYTHON_OBJECT_PATTERN.sub('', content)
     
     # Fix enum representations
     # Convert <IssueStatus.TODO: 'todo'> to 'todo'
-    content = re.sub(r'<\w+\.(\w+):\s*[\'"]?(\w+)[\'"]?>', r"'\2'", content)
+    content = ENUM_PATTERN.sub(r"'\2'", content)
     
     # Save backup if content changed
     if content != original_content:
@@ -94,28 +105,35 @@ def main():
         return 0
     
     all_valid = True
+    fixed_files = []
     
-    for filepath in yaml_files:
-        print(f"\nChecking {filepath}...")
-        issues = check_yaml_file(filepath)
+    with ProcessPoolExecutor() as executor:
+        # Files are independent, so check them all in parallel and report in order
+        results = list(executor.map(check_yaml_file, yaml_files))
         
-        if issues:
-            all_valid = False
-            print(f"❌ Issues found:")
-            for issue in issues:
-                print(f"   - {issue}")
+        for filepath, issues in zip(yaml_files, results):
+            print(f"\nChecking {filepath}...")
             
-            # Attempt to fix
-            if '--fix' in sys.argv:
-                if fix_yaml_file(filepath):
-                    # Re-validate after fix
-                    new_issues = check_yaml_file(filepath)
-                    if not new_issues:
-                        print(f"✅ Successfully fixed!")
-                    else:
-                        print(f"⚠️  Some issues remain after fix")
-        else:
-            print(f"✅ Valid YAML")
+            if issues:
+                all_valid = False
+                print(f"❌ Issues found:")
+                for issue in issues:
+                    print(f"   - {issue}")
+                
+                # Attempt to fix (writes stay sequential)
+                if '--fix' in sys.argv and fix_yaml_file(filepath):
+                    fixed_files.append(filepath)
+            else:
+                print(f"✅ Valid YAML")
+        
+        # Re-validate fixed files in parallel
+        if fixed_files:
+            print()
+            for filepath, new_issues in zip(fixed_files, executor.map(check_yaml_file, fixed_files)):
+                if not new_issues:
+                    print(f"✅ Successfully fixed {filepath}!")
+                else:
+                    print(f"⚠️  Some issues remain after fix in {filepath}")
     
     if not all_valid and '--fix' not in sys.argv:
         print("\nRun with --fix flag to attempt automatic fixes")
@@ -0,0 +1,6 @@
+"""Pytest configuration for the repository root."""
+
+# Scripts meant to be run directly with python, not collected: test_minimal.py
+# and test_tui.py fetch from GitHub, and test_basic.py is a module-level import
+# check with no test functions (it calls sys.exit(1) on failure)
+collect_ignore = ["test_basic.py", "test_minimal.py", "test_tui.py"]
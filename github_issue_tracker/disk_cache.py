@@ -1,12 +1,36 @@
 """Disk-based caching for GitHub issues."""
 
-import json
 import hashlib
+import os
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
-from .models import GitHubIssue, QueryTemplate
+import orjson
+from pydantic import TypeAdapter
+
+from .models import ISSUE_LIST_ADAPTER, GitHubIssue, QueryTemplate, share_users_and_labels
+
+# Number of templates whose issues are kept in memory
+MEMORY_CACHE_SIZE = 32
+
+# Stored listing pages not rewritten for this long are deleted on startup.
+# Changed pages are rewritten on every fetch, so this mostly drops pages
+# of listings that are no longer fetched.
+ETAG_PAGE_TTL = timedelta(days=7)
+
+
+class CachedPage(NamedTuple):
+    """One parsed page of a REST issue listing, stored with its ETag."""
+
+    etag: str
+    issues: list[GitHubIssue]
+    last_page: int | None = None  # From the Link header, if present
+    full: bool = False  # Page was full, so more pages may follow
+
+
+CACHED_PAGE_ADAPTER = TypeAdapter(CachedPage)
 
 
 class DiskCache:
@@ -16,20 +40,13 @@ class DiskCache:
         """Initialize disk cache."""
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
+        # cache key -> (cache file mtime, cached_at, issues)
+        self._mem: OrderedDict[str, tuple[int, datetime, list[GitHubIssue]]] = OrderedDict()
+        self._prune_pages()
         
     def _get_cache_key(self, template: QueryTemplate) -> str:
-        """Generate cache key from template."""
-        # Create hash from template excluding dynamic fields
-        cache_data = {
-            "repositories": [repo.model_dump() for repo in template.repositories],
-            "conditions": [cond.model_dump() for cond in template.conditions],
-            "condition_logic": template.condition_logic,
-            "state": template.state,
-            "include_discussions": template.include_discussions,
-            "max_age_months": template.max_age_months
-        }
-        cache_str = json.dumps(cache_data, sort_keys=True)
-        return hashlib.md5(cache_str.encode()).hexdigest()
+        """Get the cache key for a template (memoized on the template)."""
+        return template.cache_key
     
     def _get_cache_path(self, cache_key: str) -> Path:
         """Get cache file path."""
@@ -39,49 +56,86 @@ class DiskCache:
         """Get cache metadata file path."""
         return self.cache_dir / f"{cache_key}.meta.json"
     
-    def get_cached_issues(self, template: QueryTemplate) -> list[GitHubIssue] | None:
-        """Get cached issues for template."""
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        """Write serialized JSON to a temp file and swap it into place."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    
+    def _load_metadata(self, template: QueryTemplate) -> dict[str, Any] | None:
+        """Load cache metadata for template."""
+        meta_path = self._get_metadata_path(self._get_cache_key(template))
+        try:
+            return orjson.loads(meta_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+    
+    def _remember(self, cache_key: str, cached_at: datetime, issues: list[GitHubIssue]) -> None:
+        """Keep a loaded issue list in memory, tagged with its cache file mtime."""
+        try:
+            mtime = self._get_cache_path(cache_key).stat().st_mtime_ns
+        except OSError:
+            return
+        self._mem[cache_key] = (mtime, cached_at, issues)
+        self._mem.move_to_end(cache_key)
+        while len(self._mem) > MEMORY_CACHE_SIZE:
+            self._mem.popitem(last=False)
+    
+    def get_cached_issues(self, template: QueryTemplate, force_stale_ok: bool = False) -> list[GitHubIssue] | None:
+        """Get cached issues for template.
+        
+        Args:
+            template: Template the issues were cached for
+            force_stale_ok: Return the cached issues even if the TTL has expired
+                (used when GitHub confirmed the data is unchanged via a 304)
+        """
         cache_key = self._get_cache_key(template)
         cache_path = self._get_cache_path(cache_key)
         meta_path = self._get_metadata_path(cache_key)
+        # Cache valid for 24 hours by default
+        cache_ttl = timedelta(hours=24)
+        
+        try:
+            mtime = cache_path.stat().st_mtime_ns
+        except OSError:
+            self._mem.pop(cache_key, None)
+            return None
         
-        if not cache_path.exists() or not meta_path.exists():
+        # Serve from memory while the cache file is unchanged on disk
+        entry = self._mem.get(cache_key)
+        if entry is not None and entry[0] == mtime:
+            self._mem.move_to_end(cache_key)
+            _, cached_time, issues = entry
+            if datetime.now() - cached_time > cache_ttl and not force_stale_ok:
+                return None
+            return list(issues)
+        
+        if not meta_path.exists():
             return None
             
         # Check if cache is still valid
         try:
-            with open(meta_path) as f:
-                metadata = json.load(f)
+            metadata = orjson.loads(meta_path.read_bytes())
             
             cached_time = datetime.fromisoformat(metadata["cached_at"])
-            # Cache valid for 24 hours by default
-            cache_ttl = timedelta(hours=24)
             
-            if datetime.now() - cached_time > cache_ttl:
+            if datetime.now() - cached_time > cache_ttl and not force_stale_ok:
                 return None
                 
-        except (json.JSONDecodeError, KeyError, ValueError):
+        except (orjson.JSONDecodeError, KeyError, ValueError):
             return None
             
-        # Load cached issues
+        # Load cached issues, parsing JSON and datetimes in pydantic-core.
+        # The cache is written by us, but validate_json is still several times
+        # faster than rebuilding the nested models with model_construct in Python.
         try:
-            with open(cache_path) as f:
-                issues_data = json.load(f)
-            
-            issues = []
-            for issue_data in issues_data:
-                # Convert datetime strings back to datetime objects
-                for date_field in ["created_at", "updated_at", "closed_at"]:
-                    if issue_data.get(date_field):
-                        issue_data[date_field] = datetime.fromisoformat(issue_data[date_field])
-                
-                issue = GitHubIssue(**issue_data)
-                issues.append(issue)
-                
-            return issues
-            
-        except (json.JSONDecodeError, KeyError, ValueError):
+            issues = ISSUE_LIST_ADAPTER.validate_json(cache_path.read_bytes())
+        except (OSError, ValueError):
             return None
+        share_users_and_labels(issues)
+        
+        self._remember(cache_key, cached_time, issues)
+        return list(issues)
     
     def cache_issues(self, template: QueryTemplate, issues: list[GitHubIssue]) -> None:
         """Cache issues to disk."""
@@ -93,30 +147,68 @@ class DiskCache:
         cache_path = self._get_cache_path(cache_key)
         meta_path = self._get_metadata_path(cache_key)
         
-        # Convert issues to JSON-serializable format
-        issues_data = []
-        for issue in issues:
-            issue_dict = issue.model_dump()
-            # Convert datetime objects to ISO strings
-            for date_field in ["created_at", "updated_at", "closed_at"]:
-                if issue_dict.get(date_field):
-                    issue_dict[date_field] = issue_dict[date_field].isoformat()
-            issues_data.append(issue_dict)
+        # Serialize straight to JSON bytes with pydantic-core; fields left at
+        # their defaults are omitted and filled back in on load
+        payload = ISSUE_LIST_ADAPTER.dump_json(issues, exclude_defaults=True)
+        payload_hash = hashlib.blake2b(payload, digest_size=16).hexdigest()
         
-        # Save issues data
-        with open(cache_path, "w") as f:
-            json.dump(issues_data, f, indent=2)
+        # Save issues data, unless an identical payload is already on disk
+        previous = self._load_metadata(template)
+        if (
+            not previous
+            or previous.get("payload_hash") != payload_hash
+            or not cache_path.exists()
+        ):
+            self._write_atomic(cache_path, payload)
         
         # Save metadata
+        cached_at = datetime.now()
         metadata = {
-            "cached_at": datetime.now().isoformat(),
+            "cached_at": cached_at.isoformat(),
             "template_name": template.name,
             "issue_count": len(issues),
-            "repositories": [repo.full_name for repo in template.repositories]
+            "repositories": [repo.full_name for repo in template.repositories],
+            "payload_hash": payload_hash
         }
         
-        with open(meta_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        self._write_atomic(meta_path, orjson.dumps(metadata))
+        self._remember(cache_key, cached_at, list(issues))
+    
+    def _get_page_path(self, listing: str, page: int) -> Path:
+        """Get the file path for one page of a REST listing."""
+        key = hashlib.blake2b(f"{listing}#{page}".encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{key}.page.json"
+    
+    def _prune_pages(self) -> None:
+        """Delete stored listing pages older than ETAG_PAGE_TTL."""
+        cutoff = (datetime.now() - ETAG_PAGE_TTL).timestamp()
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".page.json"):
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    continue
+    
+    def get_etag_page(self, listing: str, page: int) -> CachedPage | None:
+        """Get a stored listing page and its ETag for a conditional request.
+        
+        Args:
+            listing: Identifies the listing (repository plus the query
+                     parameters that do not change between fetches)
+            page: Page number
+        """
+        try:
+            return CACHED_PAGE_ADAPTER.validate_json(self._get_page_path(listing, page).read_bytes())
+        except (OSError, ValueError):
+            return None
+    
+    def put_etag_page(self, listing: str, page: int, cached_page: CachedPage) -> None:
+        """Store a listing page with its ETag, for reuse after a 304."""
+        data = CACHED_PAGE_ADAPTER.dump_json(cached_page, exclude_defaults=True)
+        self._write_atomic(self._get_page_path(listing, page), data)
     
     def clear_cache(self, template: QueryTemplate | None = None) -> None:
         """Clear cache files."""
@@ -128,30 +220,45 @@ class DiskCache:
             
             cache_path.unlink(missing_ok=True)
             meta_path.unlink(missing_ok=True)
+            self._mem.pop(cache_key, None)
         else:
-            # Clear all cache files
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
+            self._mem.clear()
+            # Clear all cache files in a single directory scan
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        # Already gone (another instance cleared it) or not removable
+                        continue
     
     def get_cache_info(self) -> dict[str, Any]:
         """Get information about cached data."""
+        # Classify entries in a single directory scan
+        with os.scandir(self.cache_dir) as entries:
+            json_files = [entry.path for entry in entries if entry.name.endswith(".json")]
+        
         cache_info = {
             "cache_dir": str(self.cache_dir),
-            "total_files": len(list(self.cache_dir.glob("*.json"))),
+            "total_files": len(json_files),
             "cached_templates": []
         }
         
-        for meta_file in self.cache_dir.glob("*.meta.json"):
+        for meta_file in json_files:
+            if not meta_file.endswith(".meta.json"):
+                continue
             try:
-                with open(meta_file) as f:
-                    metadata = json.load(f)
+                with open(meta_file, "rb") as f:
+                    metadata = orjson.loads(f.read())
                 cache_info["cached_templates"].append({
                     "name": metadata.get("template_name", "Unknown"),
                     "cached_at": metadata.get("cached_at"),
                     "issue_count": metadata.get("issue_count", 0),
                     "repositories": metadata.get("repositories", [])
                 })
-            except (json.JSONDecodeError, KeyError):
+            except (OSError, orjson.JSONDecodeError, KeyError):
                 continue
         
         return cache_info
\ No newline at end of file
@@ -105,6 +105,11 @@ class FilterConfigModal(ModalScreen):
             id="filter-config-modal",
         )
 
+    def on_mount(self) -> None:
+        """Cache the state checkboxes."""
+        self._open_checkbox = self.query_one("#show-open", Checkbox)
+        self._closed_checkbox = self.query_one("#show-closed", Checkbox)
+
     @on(Checkbox.Changed, "#show-open")
     def on_show_open_changed(self, event: Checkbox.Changed) -> None:
         """Handle open checkbox change."""
@@ -126,13 +131,15 @@ class FilterConfigModal(ModalScreen):
         elif self.show_closed:
             self.temp_state = "closed"
         else:
-            # At least one must be selected
-            if self.temp_state == "open":
-                self.show_open = True
-                self.query_one("#show-open", Checkbox).value = True
-            else:
-                self.show_closed = True
-                self.query_one("#show-closed", Checkbox).value = True
+            # At least one must be selected; re-check the box without
+            # re-entering the change handlers
+            with self.prevent(Checkbox.Changed):
+                if self.temp_state == "open":
+                    self.show_open = True
+                    self._open_checkbox.value = True
+                else:
+                    self.show_closed = True
+                    self._closed_checkbox.value = True
 
     @on(Checkbox.Changed, "#include-discussions")
     def on_include_discussions_changed(self, event: Checkbox.Changed) -> None:
@@ -1,68 +1,450 @@
 """GitHub API client for fetching issues."""
 
+import asyncio
+import logging
 import os
+import random
+import sys
 import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta
 from typing import Any
 
 import httpx
+import orjson
 import structlog
+from pydantic import ValidationError
 from rich.console import Console
 from rich.progress import Progress
 
-from .disk_cache import DiskCache
-from .gh_cli import check_gh_cli, fetch_issues_with_cli
+from .disk_cache import CachedPage, DiskCache
+from .gh_cli import check_gh_cli, get_gh_token
 from .logging_config import setup_logging
-from .models import GitHubIssue, GitHubLabel, GitHubUser, IssueStatus, QueryTemplate, Repository
+from .models import (
+    ISSUE_LIST_ADAPTER,
+    GitHubIssue,
+    IssueStatus,
+    QueryTemplate,
+    Repository,
+    share_users_and_labels,
+)
 
 console = Console()
 USE_GH_CLI = check_gh_cli()
 
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a fixed TTL."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept (least recently used go first)
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        """Get value if present and not expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value, evicting the least recently used entries if full."""
+        self._data[key] = (value, time.monotonic() + self.ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        """Drop the entry for key, if any."""
+        self._data.pop(key, None)
+
+
 # Cache for API responses (TTL: 10 minutes)
-_cache: dict[str, tuple[Any, datetime]] = {}
-CACHE_TTL = timedelta(minutes=10)
+_cache = TTLCache(maxsize=512, ttl=600)
 
 
 def get_cached(key: str) -> Any | None:
     """Get cached value if not expired."""
-    if key in _cache:
-        value, timestamp = _cache[key]
-        if datetime.now() - timestamp < CACHE_TTL:
-            return value
-        else:
-            del _cache[key]
-    return None
+    return _cache.get(key)
 
 
 def set_cache(key: str, value: Any) -> None:
-    """Set cache value with current timestamp."""
-    _cache[key] = (value, datetime.now())
+    """Set cache value."""
+    _cache.set(key, value)
+
+
+def evict_cached(key: str) -> None:
+    """Drop a cached value so the next lookup misses."""
+    _cache.pop(key)
+
+
+def _debug_enabled() -> bool:
+    """Check whether DEBUG records from this module would be emitted."""
+    return logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
+
+
+# Page size for REST issue listings (GitHub's maximum)
+ISSUES_PER_PAGE = 100
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Longest rate limit wait (seconds) worth sitting out; beyond this the
+# request fails so the user sees the rate limit instead of a stalled fetch
+MAX_RATE_LIMIT_WAIT = 60.0
 
 
-async def retry_with_backoff(func, max_retries: int = 3, base_delay: float = 1.0):
-    """Retry function with exponential backoff."""
+def _rate_limit_delay(response: httpx.Response) -> float | None:
+    """Seconds GitHub asked us to wait before retrying, if it said."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    # Primary rate limit: the budget is spent until the window resets
+    reset = response.headers.get("X-RateLimit-Reset")
+    if response.headers.get("X-RateLimit-Remaining") == "0" and reset and reset.isdigit():
+        return max(0.0, float(reset) - time.time())
+    return None
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Check whether a failed request may succeed if retried."""
+    if isinstance(error, httpx.HTTPStatusError):
+        response = error.response
+        if response.status_code in (403, 429):
+            # GitHub signals rate limits with a 403 or 429 plus headers
+            # saying how long to wait; only short waits are worth retrying
+            delay = _rate_limit_delay(response)
+            if delay is not None:
+                return delay <= MAX_RATE_LIMIT_WAIT
+        return response.status_code in RETRYABLE_STATUSES
+    return isinstance(error, httpx.TransportError)
+
+
+async def retry_with_backoff(func, *, max_retries: int = 3, base_delay: float = 1.0):
+    """Retry function with jittered exponential backoff.
+    
+    Only transport errors and retryable statuses (5xx, or a 403/429 whose
+    rate limit headers ask for a short wait) are retried; anything else is
+    raised immediately. Rate limited requests wait as long as GitHub asks.
+    """
     for attempt in range(max_retries):
         try:
             return await func()
-        except Exception as e:
-            if attempt == max_retries - 1:
-                raise e
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            if attempt == max_retries - 1 or not _is_retryable(e):
+                raise
             
-            delay = base_delay * (2 ** attempt)
-            console.print(f"[yellow]Request failed, retrying in {delay}s... (attempt {attempt + 1}/{max_retries})[/yellow]")
+            response = getattr(e, "response", None)
+            delay = _rate_limit_delay(response) if response is not None else None
+            if delay is None:
+                # Jitter keeps concurrent requests from retrying in lockstep
+                delay = base_delay * (2 ** attempt) * (0.5 + random.random())
+            console.print(f"[yellow]Request failed, retrying in {delay:.1f}s... (attempt {attempt + 1}/{max_retries})[/yellow]")
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """Tracks GitHub's primary rate limits from response headers.
+    
+    Installed as event hooks on a client's HTTP client, so every request it
+    makes shares the budget: once a resource's budget is spent, further
+    requests for it wait for the window to reset, if that is soon enough.
+    """
+
+    def __init__(self, max_wait: float = MAX_RATE_LIMIT_WAIT):
+        """Initialize the limiter.
+        
+        Args:
+            max_wait: Longest wait for a reset; requests go ahead (and fail)
+                      rather than wait longer
+        """
+        self.max_wait = max_wait
+        # Rate limit resource ("core", "graphql") -> (remaining, reset timestamp)
+        self.limits: dict[str, tuple[int, float]] = {}
+
+    @staticmethod
+    def _resource(request: httpx.Request) -> str:
+        """The rate limit bucket a request is counted against."""
+        return "graphql" if request.url.path == "/graphql" else "core"
+
+    async def before_request(self, request: httpx.Request) -> None:
+        """Wait for the rate limit window to reset if the budget is spent."""
+        remaining, reset_at = self.limits.get(self._resource(request), (1, 0.0))
+        if remaining > 0:
+            return
+        delay = reset_at - time.time()
+        if 0 < delay <= self.max_wait:
+            console.print(f"[yellow]Rate limit reached, waiting {delay:.0f}s for it to reset...[/yellow]")
             await asyncio.sleep(delay)
 
+    async def after_response(self, response: httpx.Response) -> None:
+        """Record the budget left, as reported in the response headers."""
+        headers = response.headers
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining and remaining.isdigit() and reset and reset.isdigit():
+            resource = headers.get("X-RateLimit-Resource") or self._resource(response.request)
+            self.limits[resource] = (int(remaining), float(reset))
+
+
+# IssueStatus members by value; str-enum members hash like their values,
+# so this resolves both stored strings and IssueStatus instances
+_STATUS_BY_VALUE: dict[str, IssueStatus] = {status.value: status for status in IssueStatus}
+
+
+def _issue_sort_key(issue: GitHubIssue) -> tuple[str, str, float, str]:
+    """Sort key for issues: Type → Repo → Date (newest first) → Title."""
+    return (
+        issue.detected_type.value,
+        issue.repository_name,
+        -issue.updated_at.timestamp(),  # Negative for descending order
+        issue.title.lower(),
+    )
+
+
+# Issue states for the GraphQL ``states`` argument (None means all)
+GRAPHQL_ISSUE_STATES: dict[str, list[str] | None] = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED"],
+    "all": None,
+}
+
+# Selects only the fields GitHubIssue needs
+ISSUE_FIELDS_FRAGMENT = """
+fragment IssueFields on Issue {
+    databaseId
+    number
+    title
+    body
+    state
+    url
+    createdAt
+    updatedAt
+    closedAt
+    author {
+        login
+        avatarUrl
+        url
+        ... on User {
+            databaseId
+        }
+    }
+    assignees(first: 10) {
+        nodes {
+            login
+            databaseId
+            avatarUrl
+            url
+        }
+    }
+    labels(first: 20) {
+        nodes {
+            name
+            color
+            description
+        }
+    }
+    comments {
+        totalCount
+    }
+}
+"""
+
+# Arguments of the ``issues`` connection, newest updates first
+ISSUES_CONNECTION_ARGS = (
+    "first: 100, states: $states, filterBy: {since: $since}, "
+    "orderBy: {field: UPDATED_AT, direction: DESC}"
+)
+
+ISSUES_QUERY = """
+query($owner: String!, $repo: String!, $states: [IssueState!], $since: DateTime, $cursor: String) {
+    repository(owner: $owner, name: $repo) {
+        issues(after: $cursor, %s) {
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+            nodes {
+                ...IssueFields
+            }
+        }
+    }
+}
+""" % ISSUES_CONNECTION_ARGS + ISSUE_FIELDS_FRAGMENT
+
+# Discussions are only exposed through GraphQL
+DISCUSSIONS_QUERY = """
+query($owner: String!, $repo: String!, $cursor: String) {
+    repository(owner: $owner, name: $repo) {
+        discussions(first: 100, after: $cursor) {
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+            nodes {
+                databaseId
+                number
+                title
+                body
+                createdAt
+                updatedAt
+                closedAt
+                closed
+                url
+                author {
+                    login
+                    ... on User {
+                        databaseId
+                        avatarUrl
+                        url
+                    }
+                }
+                labels(first: 10) {
+                    nodes {
+                        name
+                        color
+                        description
+                    }
+                }
+                comments {
+                    totalCount
+                }
+            }
+        }
+    }
+}
+"""
+
+
+def _graphql_body_prefix(query: str) -> bytes:
+    """Pre-encode the constant part of a GraphQL request body."""
+    return b'{"query":' + orjson.dumps(query) + b',"variables":'
+
+
+def _graphql_body(prefix: bytes, variables: dict[str, Any]) -> bytes:
+    """Complete a pre-encoded GraphQL request body with its variables."""
+    return prefix + orjson.dumps(variables) + b"}"
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Request body prefixes for the fixed queries, encoded once at import
+ISSUES_QUERY_PREFIX = _graphql_body_prefix(ISSUES_QUERY)
+DISCUSSIONS_QUERY_PREFIX = _graphql_body_prefix(DISCUSSIONS_QUERY)
+
+# Number of repositories aliased into one batched GraphQL request
+GRAPHQL_BATCH_SIZE = 5
+# Maximum number of batched GraphQL requests in flight
+GRAPHQL_BATCH_CONCURRENCY = 4
+# Maximum number of repositories fetched at once per client
+REPO_CONCURRENCY = 8
+
+
+def build_issues_batch_query(aliases: list[str]) -> str:
+    """Build a GraphQL query with one aliased ``repository`` per alias.
+    
+    Each alias ``a`` takes the variables ``$a_owner``, ``$a_repo`` and
+    ``$a_cursor``; ``$states`` and ``$since`` are shared.
+    """
+    params = ["$states: [IssueState!]", "$since: DateTime"]
+    fields = []
+    for alias in aliases:
+        params.append(f"${alias}_owner: String!, ${alias}_repo: String!, ${alias}_cursor: String")
+        fields.append(
+            f"{alias}: repository(owner: ${alias}_owner, name: ${alias}_repo) {{ "
+            f"issues(after: ${alias}_cursor, {ISSUES_CONNECTION_ARGS}) {{ "
+            "pageInfo { hasNextPage endCursor } nodes { ...IssueFields } } }"
+        )
+    return f"query({', '.join(params)}) {{\n" + "\n".join(fields) + "\n}\n" + ISSUE_FIELDS_FRAGMENT
+
+
+def _user_from_graphql(actor: dict[str, Any] | None) -> dict[str, Any]:
+    """Convert a GraphQL actor (None for deleted users) to GitHubUser data."""
+    actor = actor or {"login": "ghost"}
+    return {
+        "login": actor.get("login", "unknown"),
+        "id": actor.get("databaseId") or 0,
+        "avatar_url": actor.get("avatarUrl", ""),
+        "html_url": actor.get("url", ""),
+    }
+
+
+def _issue_from_graphql(node: dict[str, Any], repo: Repository) -> dict[str, Any]:
+    """Convert a GraphQL issue or discussion node to GitHubIssue data in REST shape."""
+    assignees = [_user_from_graphql(a) for a in (node.get("assignees") or {}).get("nodes", []) if a]
+    return {
+        "id": node.get("databaseId") or node["number"],
+        "number": node["number"],
+        "title": node["title"],
+        "body": node.get("body"),
+        # Discussions have no state, only a closed flag
+        "state": node["state"].lower() if "state" in node else ("closed" if node.get("closed") else "open"),
+        "html_url": node["url"],
+        # ISO strings (with a trailing "Z") are parsed by pydantic-core
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+        "closed_at": node.get("closedAt"),
+        "user": _user_from_graphql(node.get("author")),
+        "assignee": assignees[0] if assignees else None,
+        "assignees": assignees,
+        "labels": [
+            {
+                "id": 0,  # GraphQL labels only expose opaque node IDs
+                "name": label["name"],
+                "color": label.get("color", ""),
+                "description": label.get("description"),
+            }
+            for label in (node.get("labels") or {}).get("nodes", [])
+            if label
+        ],
+        "repository_url": f"https://api.github.com/repos/{repo.full_name}",
+        "comments": (node.get("comments") or {}).get("totalCount", 0),
+        "repository_name": repo.full_name,
+    }
+
+
+def _since_iso(max_age_months: int) -> str:
+    """Start of the fetch window, truncated to the hour.
+    
+    Truncating lets repeated fetches (from any template) share cache
+    entries and request URLs within the hour.
+    """
+    since_date = datetime.now() - timedelta(days=max_age_months * 30)
+    since_date = since_date.replace(minute=0, second=0, microsecond=0)
+    return since_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+
 
 class GitHubClient:
     """Client for interacting with GitHub API."""
 
-    def __init__(self, token: str | None = None, use_cache: bool = True):
+    def __init__(
+        self,
+        token: str | None = None,
+        use_cache: bool = True,
+        repo_concurrency: int = REPO_CONCURRENCY,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
         """Initialize GitHub client.
         
         Args:
             token: GitHub personal access token. If not provided, 
                    will try to read from GITHUB_TOKEN env var or gh CLI.
             use_cache: Whether to use disk caching (default: True)
+            repo_concurrency: Maximum number of repositories fetched at once
+            transport: HTTP transport to use instead of the network
+                       (e.g. ``httpx.MockTransport`` in tests)
         """
         self.logger = setup_logging()
         
@@ -70,6 +452,9 @@ class GitHubClient:
         self.token = token or os.getenv("GITHUB_TOKEN") or self._get_gh_cli_token()
         self.use_cache = use_cache
         self.disk_cache = DiskCache() if use_cache else None
+        # Shared by every fetch on this client, so overlapping refreshes
+        # together stay under GitHub's secondary rate limits
+        self._repo_semaphore = asyncio.Semaphore(repo_concurrency)
         
         self.logger.info("Initializing GitHub client", 
                         use_cache=use_cache, 
@@ -83,29 +468,27 @@ class GitHubClient:
         if self.token:
             self.headers["Authorization"] = f"token {self.token}"
         
-        # Use async client with longer timeout for poor connections
+        # Use async client with longer timeout for poor connections; HTTP/2
+        # multiplexes the concurrent page and repo requests over one connection
+        self.rate_limiter = RateLimiter()
         self.client = httpx.AsyncClient(
             headers=self.headers, 
             timeout=httpx.Timeout(300.0, connect=30.0),
-            limits=httpx.Limits(max_connections=10)
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=True,
+            transport=transport,
+            event_hooks={
+                "request": [self.rate_limiter.before_request],
+                "response": [self.rate_limiter.after_response],
+            },
         )
     
     def _get_gh_cli_token(self) -> str | None:
         """Get GitHub token from gh CLI if available."""
-        try:
-            import subprocess
-            result = subprocess.run(
-                ["gh", "auth", "token"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                self.logger.info("Retrieved token from gh CLI")
-                return result.stdout.strip()
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-        return None
+        token = get_gh_token()
+        if token:
+            self.logger.info("Retrieved token from gh CLI")
+        return token
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -113,6 +496,10 @@ class GitHubClient:
 
     async def __aexit__(self, *args):
         """Async context manager exit."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and its pooled connections."""
         await self.client.aclose()
 
     def __enter__(self):
@@ -124,28 +511,37 @@ class GitHubClient:
         # Don't close in sync context - let it be handled by async context
         pass
 
-    async def fetch_issues_async(self, repo: Repository, state: str = "open", max_age_months: int = 12) -> list[GitHubIssue]:
+    async def fetch_issues_async(
+        self,
+        repo: Repository,
+        state: str = "open",
+        max_age_months: int = 12,
+        conditional: bool = True,
+    ) -> list[GitHubIssue]:
         """Fetch issues from a repository asynchronously.
         
         Args:
             repo: Repository to fetch issues from
             state: Issue state filter (open, closed, all)
             max_age_months: Only fetch issues updated in last N months
+            conditional: Send the ETag stored for each page as If-None-Match,
+                         so unchanged pages come back as (rate-limit free)
+                         304s and are reused from the disk cache
             
         Returns:
-            List of GitHub issues
+            List of GitHub issues. The list is shared through the response
+            cache, so callers must copy before mutating it or its issues.
         """
-        cache_key = f"issues:{repo.full_name}:{state}:{max_age_months}"
+        # Calculate since date for API filtering
+        since_iso = _since_iso(max_age_months)
+        
+        cache_key = f"issues:{repo.full_name}:{state}:{since_iso}"
         cached = get_cached(cache_key)
         if cached is not None:
             self.logger.info("CACHE HIT - returning cached issues", 
                            repo=repo.full_name, 
                            cached_count=len(cached))
-            return list(cached)
-        
-        # Calculate since date for API filtering
-        since_date = datetime.now() - timedelta(days=max_age_months * 30)
-        since_iso = since_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+            return cached
         
         self.logger.info("FETCHING FRESH ISSUES FROM API", 
                         repo=repo.full_name, 
@@ -155,130 +551,390 @@ class GitHubClient:
         
         # Skip GitHub CLI - it's timing out
         # Just use the API directly with the token we retrieved
-                
-        issues = []
-        page = 1
-        per_page = 100
         
-        while True:
-            url = f"https://api.github.com/repos/{repo.full_name}/issues"
-            params: dict[str, str | int] = {
+        # Parse the listing URL once; each page only swaps the page parameter
+        base_url = httpx.URL(
+            f"https://api.github.com/repos/{repo.full_name}/issues",
+            params={
                 "state": state,
-                "page": page,
-                "per_page": per_page,
+                "per_page": ISSUES_PER_PAGE,
                 "sort": "updated",
                 "direction": "desc",
                 "since": since_iso,
-            }
+            },
+        )
+        # Stored pages are keyed without the hourly since value, so their ETags
+        # are still sent after it moves on; GitHub answers 304 whenever the
+        # page content is unchanged, and each 200 replaces the stored page
+        listing = f"{repo.full_name}?state={state}&max_age_months={max_age_months}"
+        pages: list[CachedPage] = []
+        
+        try:
+            # Probe with the first page; it carries the Link header
+            result = await self._fetch_issue_page(base_url, 1, repo, listing, conditional)
+            pages.append(result)
             
-            try:
-                self.logger.info("MAKING API REQUEST", 
-                                url=url, 
-                                params=params,
-                                page=page)
-                
-                async def make_request():
-                    response = await self.client.get(url, params=params)
-                    self.logger.info("API RESPONSE RECEIVED", 
-                                   status_code=response.status_code,
-                                   headers=dict(response.headers),
-                                   repo=repo.full_name,
-                                   page=page)
-                    response.raise_for_status()
-                    return response.json()
-                
-                page_issues = await retry_with_backoff(make_request)
-                
-                self.logger.info("API RESPONSE DATA", 
-                               repo=repo.full_name,
-                               page=page,
-                               response_count=len(page_issues) if page_issues else 0)
-                
-                if not page_issues:
-                    self.logger.warning("EMPTY RESPONSE - breaking pagination", 
-                                      repo=repo.full_name, page=page)
-                    break
-                
-                self.logger.info("PROCESSING PAGE ISSUES", 
-                               page=page, 
-                               count=len(page_issues),
-                               repo=repo.full_name)
-                
-                parse_errors = []
-                parsed_issues = []
-                skipped_prs = 0
-                
-                for i, issue_data in enumerate(page_issues):
-                    try:
-                        # Skip pull requests
-                        if "pull_request" in issue_data:
-                            skipped_prs += 1
-                            continue
-                        
-                        # Log first few issue data structures for debugging
-                        if len(issues) + len(parsed_issues) < 3:  # First 3 issues total
-                            self.logger.info("SAMPLE ISSUE DATA", 
-                                           repo=repo.full_name,
-                                           issue_index=i,
-                                           issue_number=issue_data.get('number', 'N/A'),
-                                           issue_title=issue_data.get('title', 'N/A')[:50],
-                                           user_id=issue_data.get('user', {}).get('id', 'N/A'),
-                                           user_id_type=type(issue_data.get('user', {}).get('id', None)).__name__)
-                        
-                        issue = GitHubIssue(**issue_data)
-                        issue.repository_name = repo.full_name
-                        parsed_issues.append(issue)
-                    except Exception as e:
-                        parse_errors.append(f"Issue {i}: {str(e)}")
-                        continue
-                
-                if parse_errors:
-                    self.logger.error("PARSING ERRORS ON PAGE", 
+            if result.last_page:
+                # The page count is known, so fetch the remaining pages concurrently.
+                # Let every page finish so one failure doesn't drop the others.
+                page_numbers = range(2, result.last_page + 1)
+                results = await asyncio.gather(*(
+                    self._fetch_issue_page(base_url, p, repo, listing, conditional)
+                    for p in page_numbers
+                ), return_exceptions=True)
+                failed = []
+                for page_number, page_result in zip(page_numbers, results, strict=True):
+                    if isinstance(page_result, httpx.HTTPError):
+                        failed.append((page_number, page_result))
+                    elif isinstance(page_result, BaseException):
+                        raise page_result
+                    else:
+                        pages.append(page_result)
+                if failed:
+                    self.logger.error("HTTP error fetching issue pages", 
                                     repo=repo.full_name,
-                                    page=page,
-                                    error_count=len(parse_errors),
-                                    first_few_errors=parse_errors[:3])
-                
-                issues.extend(parsed_issues)
+                                    pages=[page_number for page_number, _ in failed],
+                                    error=str(failed[0][1]))
+                    console.print(
+                        f"[red]Error fetching {len(failed)} of {result.last_page} pages "
+                        f"from {repo.full_name}: {failed[0][1]}[/red]"
+                    )
+                    # Keep the pages that arrived, but don't cache an incomplete listing
+                    return [issue for page in pages for issue in page.issues]
+            else:
+                # No Link header: walk the pages one at a time
+                while result.full:
+                    result = await self._fetch_issue_page(base_url, len(pages) + 1, repo, listing, conditional)
+                    pages.append(result)
                 
-                self.logger.info("PAGE PROCESSED", 
+                self.logger.info("PAGINATION COMPLETE - last page", 
                                repo=repo.full_name,
-                               page=page,
-                               raw_count=len(page_issues),
-                               skipped_prs=skipped_prs,
-                               parsed_issues=len(parsed_issues),
-                               parse_errors=len(parse_errors),
-                               total_issues_so_far=len(issues))
-                
-                # Check if there are more pages
-                if len(page_issues) < per_page:
-                    self.logger.info("PAGINATION COMPLETE - last page", 
-                                   repo=repo.full_name,
-                                   page=page,
-                                   returned_count=len(page_issues),
-                                   per_page=per_page)
-                    break
-                    
-                page += 1
-                
-            except httpx.HTTPError as e:
-                self.logger.error("HTTP error fetching issues", 
-                                repo=repo.full_name,
-                                error=str(e),
-                                page=page)
-                console.print(f"[red]Error fetching issues from {repo.full_name}: {e}[/red]")
-                # Don't cache failed requests
-                return issues
+                               page=len(pages),
+                               returned_count=len(result.issues))
+            
+        except httpx.HTTPError as e:
+            self.logger.error("HTTP error fetching issues", 
+                            repo=repo.full_name,
+                            error=str(e),
+                            page=len(pages) + 1)
+            console.print(f"[red]Error fetching issues from {repo.full_name}: {e}[/red]")
+            # Don't cache failed requests
+            return [issue for page in pages for issue in page.issues]
         
+        issues = [issue for page in pages for issue in page.issues]
         self.logger.info("API fetch complete", 
                         repo=repo.full_name,
                         total_issues=len(issues),
-                        pages_fetched=page-1)
+                        pages_fetched=len(pages))
         
         # Cache successful requests
         set_cache(cache_key, issues)
         return issues
 
+    async def _fetch_issue_page(
+        self,
+        base_url: httpx.URL,
+        page: int,
+        repo: Repository,
+        listing: str,
+        conditional: bool,
+    ) -> CachedPage:
+        """Fetch and parse one page of a REST issue listing.
+        
+        With ``conditional``, the page's stored ETag is sent as If-None-Match
+        and a 304 returns the stored page; a fresh 200 is stored for next time.
+        """
+        stored = None
+        if conditional and self.disk_cache:
+            stored = self.disk_cache.get_etag_page(listing, page)
+        
+        headers = {"If-None-Match": stored.etag} if stored else None
+        response = await self._fetch_page(base_url.copy_set_param("page", page), repo, headers)
+        
+        if response.status_code == 304 and stored:
+            self.logger.info("NOT MODIFIED - reusing stored page",
+                           repo=repo.full_name,
+                           page=page)
+            return stored
+        
+        page_issues = orjson.loads(response.content)
+        result = CachedPage(
+            etag=response.headers.get("ETag", ""),
+            issues=self._parse_page(page_issues, repo, page, (page - 1) * len(page_issues)),
+            last_page=self._last_page(response),
+            full=len(page_issues) >= ISSUES_PER_PAGE,
+        )
+        if result.etag and self.disk_cache:
+            self.disk_cache.put_etag_page(listing, page, result)
+        return result
+
+    async def _fetch_page(
+        self,
+        url: httpx.URL,
+        repo: Repository,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Fetch one page of a REST listing, retrying with backoff.
+        
+        A 304 Not Modified response is returned as-is; other error statuses
+        raise ``httpx.HTTPStatusError``.
+        """
+        page = url.params.get("page", "1")
+        self.logger.info("MAKING API REQUEST", 
+                        url=str(url), 
+                        page=page)
+        
+        async def make_request():
+            response = await self.client.get(url, headers=headers)
+            self.logger.info("API RESPONSE RECEIVED", 
+                           status_code=response.status_code,
+                           headers=dict(response.headers),
+                           repo=repo.full_name,
+                           page=page)
+            if response.status_code != 304:
+                response.raise_for_status()
+            return response
+        
+        return await retry_with_backoff(make_request)
+
+    @staticmethod
+    def _last_page(response: httpx.Response) -> int | None:
+        """Get the last page number from a response's Link header, if any."""
+        last = response.links.get("last")
+        if not last:
+            return None
+        try:
+            return int(httpx.URL(last["url"]).params["page"])
+        except (KeyError, ValueError):
+            return None
+
+    def _parse_page(
+        self,
+        page_issues: list[dict[str, Any]],
+        repo: Repository,
+        page: int,
+        issues_so_far: int,
+    ) -> list[GitHubIssue]:
+        """Parse one page of REST issue items, skipping pull requests."""
+        self.logger.info("API RESPONSE DATA", 
+                       repo=repo.full_name,
+                       page=page,
+                       response_count=len(page_issues) if page_issues else 0)
+        
+        self.logger.info("PROCESSING PAGE ISSUES", 
+                       page=page, 
+                       count=len(page_issues),
+                       repo=repo.full_name)
+        
+        parse_errors = []
+        
+        # Skip pull requests
+        clean = [issue_data for issue_data in page_issues if "pull_request" not in issue_data]
+        skipped_prs = len(page_issues) - len(clean)
+        
+        # Log first few issue data structures for debugging
+        if _debug_enabled():
+            for i, issue_data in enumerate(clean[:max(0, 3 - issues_so_far)]):
+                self.logger.debug("SAMPLE ISSUE DATA", 
+                                repo=repo.full_name,
+                                issue_index=i,
+                                issue_number=issue_data.get('number', 'N/A'),
+                                issue_title=issue_data.get('title', 'N/A')[:50],
+                                user_id=issue_data.get('user', {}).get('id', 'N/A'),
+                                user_id_type=type(issue_data.get('user', {}).get('id', None)).__name__)
+        
+        try:
+            # Validate the whole page in a single pydantic-core call
+            parsed_issues = ISSUE_LIST_ADAPTER.validate_python(clean)
+        except ValidationError:
+            # Fall back to one issue at a time so a bad item only drops itself
+            parsed_issues = []
+            for i, issue_data in enumerate(clean):
+                try:
+                    parsed_issues.append(GitHubIssue(**issue_data))
+                except Exception as e:
+                    parse_errors.append(f"Issue {i}: {str(e)}")
+        
+        # One shared string for every issue of the repository
+        repository_name = sys.intern(repo.full_name)
+        for issue in parsed_issues:
+            issue.repository_name = repository_name
+        
+        if parse_errors:
+            self.logger.error("PARSING ERRORS ON PAGE", 
+                            repo=repo.full_name,
+                            page=page,
+                            error_count=len(parse_errors),
+                            first_few_errors=parse_errors[:3])
+        
+        self.logger.info("PAGE PROCESSED", 
+                       repo=repo.full_name,
+                       page=page,
+                       raw_count=len(page_issues),
+                       skipped_prs=skipped_prs,
+                       parsed_issues=len(parsed_issues),
+                       parse_errors=len(parse_errors),
+                       total_issues_so_far=issues_so_far + len(parsed_issues))
+        
+        return parsed_issues
+
+    async def fetch_issues_graphql_async(
+        self,
+        repo: Repository,
+        state: str = "open",
+        max_age_months: int = 12,
+    ) -> list[GitHubIssue]:
+        """Fetch issues from a repository using GraphQL.
+        
+        Requests only the fields GitHubIssue needs (GraphQL requires a
+        token). Shares the in-memory cache entry with ``fetch_issues_async``.
+        
+        Raises:
+            httpx.HTTPError: If a request fails
+            RuntimeError: If GitHub reports GraphQL errors
+        """
+        since_iso = _since_iso(max_age_months)
+        cache_key = f"issues:{repo.full_name}:{state}:{since_iso}"
+        cached = get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
+        self.logger.info("FETCHING FRESH ISSUES FROM GRAPHQL", 
+                        repo=repo.full_name, 
+                        state=state,
+                        since_date=since_iso)
+        
+        issues: list[GitHubIssue] = []
+        variables: dict[str, Any] = {
+            "owner": repo.owner,
+            "repo": repo.repo,
+            "states": GRAPHQL_ISSUE_STATES.get(state),
+            "since": since_iso,
+            "cursor": None,
+        }
+        
+        while True:
+            async def make_graphql_request():
+                response = await self.client.post(
+                    "https://api.github.com/graphql",
+                    content=_graphql_body(ISSUES_QUERY_PREFIX, variables),
+                    headers=JSON_HEADERS
+                )
+                response.raise_for_status()
+                return orjson.loads(response.content)
+            
+            data = await retry_with_backoff(make_graphql_request)
+            if "errors" in data:
+                raise RuntimeError(f"GraphQL errors for {repo.full_name}: {data['errors']}")
+            
+            issues_data = ((data.get("data") or {}).get("repository") or {}).get("issues") or {}
+            issues.extend(ISSUE_LIST_ADAPTER.validate_python([
+                _issue_from_graphql(node, repo)
+                for node in issues_data.get("nodes", [])
+                if node
+            ]))
+            
+            page_info = issues_data.get("pageInfo") or {}
+            if not page_info.get("hasNextPage"):
+                break
+            variables["cursor"] = page_info.get("endCursor")
+        
+        self.logger.info("GraphQL fetch complete", 
+                        repo=repo.full_name,
+                        total_issues=len(issues))
+        
+        set_cache(cache_key, issues)
+        return issues
+
+    async def fetch_issues_graphql_batch_async(
+        self,
+        repos: list[Repository],
+        state: str = "open",
+        max_age_months: int = 12,
+    ) -> dict[str, list[GitHubIssue]]:
+        """Fetch issues for several repositories with one aliased GraphQL query per page.
+        
+        Results are stored in the in-memory cache, where
+        ``fetch_issues_graphql_async`` picks them up. Repositories that
+        GraphQL reports errors for are left out of the returned dict so the
+        caller can fall back to fetching them one by one.
+        
+        Raises:
+            httpx.HTTPError: If a request fails
+        """
+        since_iso = _since_iso(max_age_months)
+        pending = {
+            f"r{i}": repo for i, repo in enumerate(repos)
+            if get_cached(f"issues:{repo.full_name}:{state}:{since_iso}") is None
+        }
+        cursors: dict[str, str | None] = {alias: None for alias in pending}
+        results: dict[str, list[GitHubIssue]] = {repo.full_name: [] for repo in pending.values()}
+        
+        while pending:
+            # Only repositories that still have pages are part of the next query
+            query = build_issues_batch_query(list(pending))
+            variables: dict[str, Any] = {"states": GRAPHQL_ISSUE_STATES.get(state), "since": since_iso}
+            for alias, repo in pending.items():
+                variables[f"{alias}_owner"] = repo.owner
+                variables[f"{alias}_repo"] = repo.repo
+                variables[f"{alias}_cursor"] = cursors[alias]
+            
+            async def make_graphql_request():
+                response = await self.client.post(
+                    "https://api.github.com/graphql",
+                    json={"query": query, "variables": variables}
+                )
+                response.raise_for_status()
+                return orjson.loads(response.content)
+            
+            data = await retry_with_backoff(make_graphql_request)
+            repos_data = data.get("data") or {}
+            if data.get("errors"):
+                self.logger.warning("GraphQL batch errors", 
+                                  repos=[repo.full_name for repo in pending.values()],
+                                  errors=data["errors"])
+            
+            for alias, repo in list(pending.items()):
+                issues_data = (repos_data.get(alias) or {}).get("issues")
+                if issues_data is None:
+                    # This alias failed; leave the repository to the caller
+                    del pending[alias]
+                    del results[repo.full_name]
+                    continue
+                
+                results[repo.full_name].extend(ISSUE_LIST_ADAPTER.validate_python([
+                    _issue_from_graphql(node, repo)
+                    for node in issues_data.get("nodes", [])
+                    if node
+                ]))
+                
+                page_info = issues_data.get("pageInfo") or {}
+                if page_info.get("hasNextPage"):
+                    cursors[alias] = page_info.get("endCursor")
+                else:
+                    del pending[alias]
+                    set_cache(f"issues:{repo.full_name}:{state}:{since_iso}", results[repo.full_name])
+        
+        return results
+
+    async def _prefetch_issues_graphql(self, template: QueryTemplate) -> None:
+        """Warm the in-memory cache with batched GraphQL requests for all repositories."""
+        repos = template.repositories
+        batches = [repos[i:i + GRAPHQL_BATCH_SIZE] for i in range(0, len(repos), GRAPHQL_BATCH_SIZE)]
+        semaphore = asyncio.Semaphore(GRAPHQL_BATCH_CONCURRENCY)
+        
+        async def fetch_batch(batch: list[Repository]) -> dict[str, list[GitHubIssue]]:
+            async with semaphore:
+                return await self.fetch_issues_graphql_batch_async(batch, template.state, template.max_age_months)
+        
+        results = await asyncio.gather(*(fetch_batch(batch) for batch in batches), return_exceptions=True)
+        for batch, result in zip(batches, results):
+            if isinstance(result, Exception):
+                # Repositories in a failed batch are fetched one by one afterwards
+                self.logger.warning("GraphQL batch failed", 
+                                  repos=[repo.full_name for repo in batch],
+                                  error=str(result))
+
     async def fetch_discussions_async(self, repo: Repository) -> list[GitHubIssue]:
         """Fetch discussions from a repository asynchronously using GraphQL.
         
@@ -291,54 +947,11 @@ class GitHubClient:
         cache_key = f"discussions:{repo.full_name}"
         cached = get_cached(cache_key)
         if cached is not None:
-            return list(cached)
+            return cached
             
         discussions = []
         cursor = None
         
-        query = """
-        query($owner: String!, $repo: String!, $cursor: String) {
-            repository(owner: $owner, name: $repo) {
-                discussions(first: 100, after: $cursor) {
-                    pageInfo {
-                        hasNextPage
-                        endCursor
-                    }
-                    nodes {
-                        id
-                        number
-                        title
-                        body
-                        createdAt
-                        updatedAt
-                        closedAt
-                        closed
-                        url
-                        author {
-                            login
-                            ... on User {
-                                id
-                                avatarUrl
-                                url
-                            }
-                        }
-                        labels(first: 10) {
-                            nodes {
-                                id
-                                name
-                                color
-                                description
-                            }
-                        }
-                        comments {
-                            totalCount
-                        }
-                    }
-                }
-            }
-        }
-        """
-        
         while True:
             variables = {
                 "owner": repo.owner,
@@ -350,10 +963,11 @@ class GitHubClient:
                 async def make_graphql_request():
                     response = await self.client.post(
                         "https://api.github.com/graphql",
-                        json={"query": query, "variables": variables}
+                        content=_graphql_body(DISCUSSIONS_QUERY_PREFIX, variables),
+                        headers=JSON_HEADERS
                     )
                     response.raise_for_status()
-                    return response.json()
+                    return orjson.loads(response.content)
                 
                 data = await retry_with_backoff(make_graphql_request)
                 if "errors" in data:
@@ -363,48 +977,11 @@ class GitHubClient:
                 repo_data = data.get("data", {}).get("repository", {})
                 discussions_data = repo_data.get("discussions", {})
                 
-                for disc in discussions_data.get("nodes", []):
-                    if not disc:
-                        continue
-                        
-                    # Convert discussion to GitHubIssue format
-                    user_data = disc.get("author", {})
-                    user = GitHubUser(
-                        login=user_data.get("login", "unknown"),
-                        id=user_data.get("id", 0) if user_data.get("id") else 0,
-                        avatar_url=user_data.get("avatarUrl", ""),
-                        html_url=user_data.get("url", "")
-                    )
-                    
-                    labels = []
-                    for label_data in disc.get("labels", {}).get("nodes", []):
-                        if label_data:
-                            labels.append(GitHubLabel(
-                                id=int(label_data["id"].split("_")[-1]) if "_" in label_data["id"] else 0,
-                                name=label_data["name"],
-                                color=label_data["color"],
-                                description=label_data.get("description")
-                            ))
-                    
-                    issue = GitHubIssue(
-                        id=int(disc["id"].split("_")[-1]) if "_" in disc["id"] else disc["number"],
-                        number=disc["number"],
-                        title=disc["title"],
-                        body=disc.get("body"),
-                        state="closed" if disc.get("closed") else "open",
-                        html_url=disc["url"],
-                        created_at=datetime.fromisoformat(disc["createdAt"].replace("Z", "+00:00")),
-                        updated_at=datetime.fromisoformat(disc["updatedAt"].replace("Z", "+00:00")),
-                        closed_at=datetime.fromisoformat(disc["closedAt"].replace("Z", "+00:00")) if disc.get("closedAt") else None,
-                        user=user,
-                        labels=labels,
-                        repository_url=f"https://api.github.com/repos/{repo.full_name}",
-                        comments=disc.get("comments", {}).get("totalCount", 0),
-                        repository_name=repo.full_name,
-                        is_discussion=True
-                    )
-                    
-                    discussions.append(issue)
+                discussions.extend(ISSUE_LIST_ADAPTER.validate_python([
+                    {**_issue_from_graphql(disc, repo), "is_discussion": True}
+                    for disc in discussions_data.get("nodes", [])
+                    if disc
+                ]))
                 
                 # Check pagination
                 page_info = discussions_data.get("pageInfo", {})
@@ -421,19 +998,48 @@ class GitHubClient:
         return discussions
 
 
-    async def fetch_repo_data_async(self, repo: Repository, template: QueryTemplate, progress_task) -> list[GitHubIssue]:
-        """Fetch all data for a single repository."""
+    async def fetch_repo_data_async(
+        self,
+        repo: Repository,
+        template: QueryTemplate,
+        progress_task,
+        conditional: bool = True,
+    ) -> list[GitHubIssue]:
+        """Fetch all data for a single repository.
+        
+        Issues come from GraphQL when a token is available, and from the REST
+        API otherwise or if GraphQL fails. ``conditional`` controls whether
+        REST pages are revalidated with their stored ETags.
+        """
         self.logger.info(f"FETCH_REPO_DATA_ASYNC START", repo=repo.full_name)
         
-        repo_issues = await self.fetch_issues_async(repo, template.state, template.max_age_months)
-        self.logger.info(f"ISSUES FETCHED", repo=repo.full_name, count=len(repo_issues))
+        async def fetch_issues() -> list[GitHubIssue]:
+            if self.token:
+                # GraphQL needs a token; it fetches lean pages with only the fields we use
+                try:
+                    return await self.fetch_issues_graphql_async(repo, template.state, template.max_age_months)
+                except (httpx.HTTPError, RuntimeError, ValueError) as e:
+                    self.logger.warning("GraphQL fetch failed - falling back to REST",
+                                      repo=repo.full_name,
+                                      error=str(e))
+            
+            return await self.fetch_issues_async(
+                repo, template.state, template.max_age_months, conditional=conditional
+            )
         
-        # Fetch discussions if requested
+        # Issues and discussions are independent, so fetch them concurrently
+        tasks = [fetch_issues()]
         if template.include_discussions:
             self.logger.info(f"FETCHING DISCUSSIONS", repo=repo.full_name)
-            discussions = await self.fetch_discussions_async(repo)
+            tasks.append(self.fetch_discussions_async(repo))
+        results = await asyncio.gather(*tasks)
+        
+        repo_issues = results[0]
+        self.logger.info(f"ISSUES FETCHED", repo=repo.full_name, count=len(repo_issues))
+        if len(results) > 1:
+            discussions = results[1]
             self.logger.info(f"DISCUSSIONS FETCHED", repo=repo.full_name, count=len(discussions))
-            repo_issues.extend(discussions)
+            repo_issues = repo_issues + discussions
         
         # Filter by conditions
         self.logger.info("APPLYING CONDITIONS FILTER",
@@ -442,52 +1048,71 @@ class GitHubClient:
                         conditions_count=len(template.conditions),
                         condition_logic=template.condition_logic)
         
+        # Per-condition and per-issue details are only built at DEBUG level
+        debug = _debug_enabled()
+        
         # Log the actual conditions being used
-        for i, condition in enumerate(template.conditions):
-            self.logger.info("CONDITION DETAILS",
-                           repo=repo.full_name,
-                           condition_index=i,
-                           condition_type=condition.type.value if hasattr(condition.type, 'value') else str(condition.type),
-                           condition_value=condition.value,
-                           case_sensitive=getattr(condition, 'case_sensitive', True),
-                           negate=getattr(condition, 'negate', False))
+        if debug:
+            for i, condition in enumerate(template.conditions):
+                self.logger.debug("CONDITION DETAILS",
+                                repo=repo.full_name,
+                                condition_index=i,
+                                condition_type=condition.type.value if hasattr(condition.type, 'value') else str(condition.type),
+                                condition_value=condition.value,
+                                case_sensitive=getattr(condition, 'case_sensitive', True),
+                                negate=getattr(condition, 'negate', False))
         
         try:
-            matching_issues = []
-            sample_checks = []  # Track first few for debugging
-            
-            for i, issue in enumerate(repo_issues):
+            matching_issues = None
+            if not debug:
+                # Evaluate one compiled condition at a time over the whole batch
                 try:
-                    matches = issue.matches_conditions(template.conditions, template.condition_logic)
-                    
-                    # Log details for first few issues
-                    if i < 5:  # First 5 issues per repo
-                        sample_checks.append({
-                            'issue_number': issue.number,
-                            'issue_title': issue.title[:50] + '...' if len(issue.title) > 50 else issue.title,
-                            'labels': [label.name for label in issue.labels],
-                            'matches': matches
-                        })
-                    
-                    if matches:
-                        matching_issues.append(issue)
-                        # Log all matches for debugging
-                        self.logger.info("ISSUE MATCHED CONDITIONS",
-                                       repo=repo.full_name,
-                                       issue_number=issue.number,
-                                       issue_title=issue.title[:50])
+                    matching_issues = template.filter_issues(repo_issues)
                 except Exception as e:
-                    self.logger.error("ERROR FILTERING INDIVIDUAL ISSUE",
-                                    repo=repo.full_name,
-                                    issue_number=issue.number,
-                                    issue_title=issue.title[:50],
-                                    error=str(e))
-                    continue
+                    self.logger.warning("BATCH FILTER FAILED - checking issues individually",
+                                      repo=repo.full_name,
+                                      error=str(e))
+            
+            if matching_issues is None:
+                # Conditions are compiled once per template, not re-read per issue
+                match = template.matcher
+                matching_issues = []
+                sample_checks = []  # Track first few for debugging
+                
+                for i, issue in enumerate(repo_issues):
+                    try:
+                        matches = match(issue)
+                        
+                        # Log details for first few issues
+                        if debug and i < 5:  # First 5 issues per repo
+                            sample_checks.append({
+                                'issue_number': issue.number,
+                                'issue_title': issue.title[:50] + '...' if len(issue.title) > 50 else issue.title,
+                                'labels': [label.name for label in issue.labels],
+                                'matches': matches
+                            })
+                        
+                        if matches:
+                            matching_issues.append(issue)
+                            # Log all matches for debugging
+                            if debug:
+                                self.logger.debug("ISSUE MATCHED CONDITIONS",
+                                                repo=repo.full_name,
+                                                issue_number=issue.number,
+                                                issue_title=issue.title[:50])
+                    except Exception as e:
+                        self.logger.error("ERROR FILTERING INDIVIDUAL ISSUE",
+                                        repo=repo.full_name,
+                                        issue_number=issue.number,
+                                        issue_title=issue.title[:50],
+                                        error=str(e))
+                        continue
             
             # Log sample check results
-            self.logger.info("SAMPLE FILTERING RESULTS",
-                           repo=repo.full_name,
-                           sample_checks=sample_checks)
+            if debug:
+                self.logger.debug("SAMPLE FILTERING RESULTS",
+                                repo=repo.full_name,
+                                sample_checks=sample_checks)
             
             self.logger.info("CONDITION FILTERING COMPLETE", 
                             repo=repo.full_name,
@@ -508,11 +1133,40 @@ class GitHubClient:
         Args:
             template: Query template with repositories and conditions
             progress: Optional progress bar
-            force_refresh: Force refresh from API, ignore cache
+            force_refresh: Force refresh from API, ignore cache. On the
+                           tokenless REST path pages are still revalidated
+                           with their stored ETags, since a 304 proves the
+                           stored page is current
             
         Returns:
             List of matching GitHub issues
         """
+        issues: list[GitHubIssue] = []
+        # Each batch holds everything fetched so far, so the last one is complete
+        async for batch in self.iter_issues_async(template, progress, force_refresh):
+            issues = batch
+        return issues
+
+    async def iter_issues_async(
+        self,
+        template: QueryTemplate,
+        progress: Progress | None = None,
+        force_refresh: bool = False,
+    ) -> AsyncIterator[list[GitHubIssue]]:
+        """Fetch the template's issues, yielding them as repositories finish.
+        
+        Each yield is a new list of every issue fetched so far, finalized and
+        sorted like ``fetch_all_issues_async``'s result, so callers can show
+        the first repositories' issues while the rest are in flight. The last
+        list is complete; nothing is yielded if no issues match. A disk cache
+        hit is yielded in one go.
+        
+        Args:
+            template: Query template with repositories and conditions
+            progress: Optional progress bar
+            force_refresh: Force refresh from API, ignore cache (see
+                           ``fetch_all_issues_async``)
+        """
         # Check disk cache first (unless force refresh)
         if self.disk_cache and not force_refresh:
             self.logger.info("Checking disk cache", template_name=template.name)
@@ -523,36 +1177,9 @@ class GitHubClient:
                                cached_count=len(cached_issues))
                 console.print(f"[green]Loaded {len(cached_issues)} issues from cache[/green]")
                 
-                # Apply ignore list and custom fields to cached issues
-                for issue in cached_issues:
-                    if issue.number in template.ignored_issues:
-                        issue.is_ignored = True
-                    
-                    # Apply custom status and notes
-                    if issue.number in template.status_overrides:
-                        status_value = template.status_overrides[issue.number]
-                        # Ensure we have an IssueStatus enum (convert from string if needed)
-                        if isinstance(status_value, str):
-                            issue.custom_status = IssueStatus(status_value)
-                        else:
-                            issue.custom_status = status_value
-                    else:
-                        # If no custom status is set and the issue is closed, automatically set to done
-                        if issue.state == "closed" and issue.custom_status == IssueStatus.NONE:
-                            issue.custom_status = IssueStatus.DONE
-                    
-                    if issue.number in template.notes:
-                        issue.custom_note = template.notes[issue.number]
-                
-                # Sort cached issues by: Type → Repo → Date (newest first) → Title
-                cached_issues.sort(key=lambda x: (
-                    x.detected_type.value,
-                    x.repository_name,
-                    -x.updated_at.timestamp(),  # Negative for descending order
-                    x.title.lower()
-                ))
-                
-                return cached_issues
+                # Apply ignore list and custom fields, then sort
+                yield self._finalize(cached_issues, template)
+                return
             else:
                 self.logger.info("Cache miss - will fetch from API", template_name=template.name)
         elif force_refresh:
@@ -561,73 +1188,70 @@ class GitHubClient:
                 # Clear this template's cache entry when force refreshing
                 self.disk_cache.clear_cache(template)
                 self.logger.info("Cleared cache for template", template_name=template.name)
+            # The response cache would otherwise answer for up to its TTL
+            since_iso = _since_iso(template.max_age_months)
+            for repo in template.repositories:
+                evict_cached(f"issues:{repo.full_name}:{template.state}:{since_iso}")
+                evict_cached(f"discussions:{repo.full_name}")
         
-        all_issues: list[GitHubIssue] = []
+        # With a token, fetch the issues of several repositories per GraphQL
+        # request up front; the per-repo fetches below then hit the cache
+        if self.token and len(template.repositories) > 1:
+            await self._prefetch_issues_graphql(template)
         
-        # Fetch repositories sequentially
+        # Pre-create progress tasks so every repo shows up immediately
+        task_ids = {}
         if progress:
-            for i, repo in enumerate(template.repositories):
-                self.logger.info(f"STARTING REPO {i+1}/{len(template.repositories)}", 
+            for repo in template.repositories:
+                task_ids[repo.full_name] = progress.add_task(f"[cyan]{repo.full_name}", total=1)
+        
+        # Fetch repositories concurrently, bounded to stay clear of GitHub's secondary rate limits
+        semaphore = self._repo_semaphore
+        repo_count = len(template.repositories)
+        
+        async def fetch_one(i: int, repo: Repository) -> list[GitHubIssue]:
+            async with semaphore:
+                self.logger.info(f"STARTING REPO {i+1}/{repo_count}", 
                                repo=repo.full_name,
                                index=i)
-                task_id = progress.add_task(f"[cyan]{repo.full_name}", total=1)
+                task_id = task_ids.get(repo.full_name)
                 try:
                     repo_issues = await self.fetch_repo_data_async(repo, template, task_id)
-                    self.logger.info(f"REPO COMPLETE {i+1}/{len(template.repositories)}", 
-                                   repo=repo.full_name,
-                                   issues_found=len(repo_issues))
-                    all_issues.extend(repo_issues)
-                    progress.update(task_id, completed=1)
                 except Exception as e:
+                    # Report every failed repository explicitly rather than dropping it
                     console.print(f"[red]Error fetching from {repo.full_name}: {e}[/red]")
                     self.logger.error("Error fetching repository", 
                                     repo=repo.full_name,
                                     error=str(e))
-        else:
-            for i, repo in enumerate(template.repositories):
-                self.logger.info(f"STARTING REPO {i+1}/{len(template.repositories)}", 
+                    return []
+                self.logger.info(f"REPO COMPLETE {i+1}/{repo_count}", 
                                repo=repo.full_name,
-                               index=i)
-                try:
-                    repo_issues = await self.fetch_repo_data_async(repo, template, None)
-                    self.logger.info(f"REPO COMPLETE {i+1}/{len(template.repositories)}", 
-                                   repo=repo.full_name,
-                                   issues_found=len(repo_issues))
-                    all_issues.extend(repo_issues)
-                except Exception as e:
-                    console.print(f"[red]Error fetching from {repo.full_name}: {e}[/red]")
-                    self.logger.error("Error fetching repository", 
-                                    repo=repo.full_name,
-                                    error=str(e))
-        
-        # Apply ignore list and custom fields
-        for issue in all_issues:
-            if issue.number in template.ignored_issues:
-                issue.is_ignored = True
-            
-            # Apply custom status and notes
-            if issue.number in template.status_overrides:
-                status_value = template.status_overrides[issue.number]
-                # Ensure we have an IssueStatus enum (convert from string if needed)
-                if isinstance(status_value, str):
-                    issue.custom_status = IssueStatus(status_value)
-                else:
-                    issue.custom_status = status_value
-            else:
-                # If no custom status is set and the issue is closed, automatically set to done
-                if issue.state == "closed" and issue.custom_status == IssueStatus.NONE:
-                    issue.custom_status = IssueStatus.DONE
-            
-            if issue.number in template.notes:
-                issue.custom_note = template.notes[issue.number]
+                               issues_found=len(repo_issues))
+                if progress:
+                    progress.update(task_id, completed=1)
+                return repo_issues
         
-        # Sort by: Type → Repo → Date (newest first) → Title
-        all_issues.sort(key=lambda x: (
-            x.detected_type.value,
-            x.repository_name,
-            -x.updated_at.timestamp(),  # Negative for descending order
-            x.title.lower()
-        ))
+        tasks = [asyncio.create_task(fetch_one(i, repo)) for i, repo in enumerate(template.repositories)]
+        all_issues: list[GitHubIssue] = []
+        pool: dict[Any, Any] = {}
+        try:
+            for next_repo in asyncio.as_completed(tasks):
+                repo_issues = await next_repo
+                if not repo_issues:
+                    continue
+                # Issues can be shared with other templates through the response
+                # cache, so copy them before applying this template's fields
+                batch = [issue.model_copy() for issue in repo_issues]
+                share_users_and_labels(batch, pool)
+                # Apply ignore list and custom fields, then sort; both lists
+                # are already in order, so the sort only merges them
+                batch = self._finalize(batch, template)
+                all_issues = sorted(all_issues + batch, key=_issue_sort_key)
+                yield all_issues
+        finally:
+            # No-op unless the caller stopped early; don't leave fetches running
+            for task in tasks:
+                task.cancel()
         
         # Log final results
         self.logger.info("FETCH ALL ISSUES COMPLETE", 
@@ -638,8 +1262,37 @@ class GitHubClient:
         # Cache results to disk (only if we got results)
         if self.disk_cache and all_issues:
             self.disk_cache.cache_issues(template, all_issues)
+
+    def _finalize(self, issues: list[GitHubIssue], template: QueryTemplate) -> list[GitHubIssue]:
+        """Apply the template's ignore list, statuses and notes, then sort.
         
-        return all_issues
+        The template is the source of truth for these fields: cached issues
+        may carry values the TUI has since un-set, so every issue is reset
+        rather than only the overridden ones being updated.
+        """
+        ignored = set(template.ignored_issues)
+        overrides = template.status_overrides
+        notes = template.notes
+        
+        for issue in issues:
+            number = issue.number
+            issue.is_ignored = number in ignored
+            
+            # Apply custom status (stored as a string or an IssueStatus)
+            status_value = overrides.get(number)
+            if status_value is not None:
+                issue.custom_status = _STATUS_BY_VALUE[status_value]
+            elif issue.state == "closed":
+                # If no custom status is set and the issue is closed, automatically set to done
+                issue.custom_status = IssueStatus.DONE
+            else:
+                issue.custom_status = IssueStatus.NONE
+            
+            issue.custom_note = notes.get(number, "")
+        
+        # Sort by: Type → Repo → Date (newest first) → Title
+        issues.sort(key=_issue_sort_key)
+        return issues
 
     async def fetch_all_issues_with_progress(self, template: QueryTemplate, force_refresh: bool = False) -> list[GitHubIssue]:
         """Fetch all issues with progress bar."""
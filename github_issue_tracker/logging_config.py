@@ -1,15 +1,36 @@
 """Structured logging configuration."""
 
+import atexit
 import logging
+import os
+import queue
 import sys
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 import structlog
 
 
+# Size cap for one run's log file, and how many rotated files it may keep
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+_configured = False
+
+
 def setup_logging():
-    """Set up structured logging with file rotation."""
+    """Set up structured logging with file rotation.
+    
+    The level defaults to INFO; set GITHUB_TRACKER_LOG_LEVEL=DEBUG to
+    also record per-issue details. Only the first call configures
+    logging; later calls (one per client) just return a logger.
+    """
+    global _configured
+    if _configured:
+        return structlog.get_logger()
+    
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
     
@@ -19,12 +40,25 @@ def setup_logging():
     # Create log file with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = logs_dir / f"github_tracker_{timestamp}.log"
+    file_handler = RotatingFileHandler(
+        log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+    )
+    
+    # Also log to console for immediate feedback
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(logging.INFO)
+    
+    # Log calls only enqueue records; a listener thread does the writing
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
     
     # Configure structlog
     logging.basicConfig(
         format="%(message)s",
-        stream=open(log_file, "w", encoding="utf-8"),
-        level=logging.DEBUG,
+        handlers=[QueueHandler(log_queue)],
+        level=getattr(logging, os.getenv("GITHUB_TRACKER_LOG_LEVEL", "INFO").upper(), logging.INFO),
     )
     
     structlog.configure(
@@ -44,27 +78,25 @@ def setup_logging():
         cache_logger_on_first_use=True,
     )
     
-    # Also log to console for immediate feedback
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    logging.getLogger().addHandler(console_handler)
-    
+    _configured = True
     return structlog.get_logger()
 
 
 def cleanup_old_logs(logs_dir: Path, max_age_days: int = 16):
-    """Remove log files older than max_age_days."""
-    cutoff_date = datetime.now() - timedelta(days=max_age_days)
+    """Remove log files not modified in max_age_days."""
+    cutoff = time.time() - max_age_days * 86400
     
-    for log_file in logs_dir.glob("github_tracker_*.log"):
-        try:
-            # Extract timestamp from filename
-            timestamp_str = log_file.stem.replace("github_tracker_", "")
-            file_date = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-            
-            if file_date < cutoff_date:
-                log_file.unlink()
-                print(f"Cleaned up old log: {log_file}")
-        except (ValueError, OSError):
-            # Skip files that don't match our naming pattern
-            continue
\ No newline at end of file
+    try:
+        with os.scandir(logs_dir) as entries:
+            for entry in entries:
+                # Rotated backups end in .log.1, .log.2, ...
+                if not entry.name.startswith("github_tracker_") or ".log" not in entry.name:
+                    continue
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        print(f"Cleaned up old log: {entry.path}")
+                except OSError:
+                    continue
+    except OSError:
+        return
@@ -1,9 +1,15 @@
 """Data models for GitHub Issue Tracker."""
 
+import hashlib
+import re
+import sys
+from collections.abc import Callable, Mapping
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
+from typing import Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 
 class ConditionType(str, Enum):
@@ -44,6 +50,25 @@ class IssueType(str, Enum):
     ISSUE = "issue"  # generic issue
 
 
+# Lowercased label names and title tags that mark an issue's type
+LABEL_TYPES = {
+    "bug": IssueType.BUG,
+    "feature": IssueType.FEATURE,
+    "enhancement": IssueType.FEATURE,
+    "feature request": IssueType.FEATURE,
+    "question": IssueType.QUESTION,
+}
+TITLE_TAG_TYPES = {
+    "bug": IssueType.BUG,
+    "feature": IssueType.FEATURE,
+    "feat": IssueType.FEATURE,
+    "question": IssueType.QUESTION,
+}
+TITLE_TAG_PATTERN = re.compile(r"\[(bug|feature|feat|question)\]")
+# When several types match, the first in this order wins
+TYPE_PRIORITY = (IssueType.BUG, IssueType.FEATURE, IssueType.QUESTION)
+
+
 class Repository(BaseModel):
     """GitHub repository reference."""
 
@@ -64,6 +89,76 @@ class Condition(BaseModel):
     case_sensitive: bool = True
     negate: bool = False
 
+    def compile(self) -> Callable[["GitHubIssue"], bool]:
+        """Build a predicate for this condition, negation included.
+        
+        The value is specialized once (lowercased, or parsed as a date) so
+        checking an issue does no per-call parsing.
+        """
+        value = self.value
+
+        if self.type == ConditionType.LABEL:
+            def check(issue: "GitHubIssue") -> bool:
+                return value in issue.label_set
+        elif self.type == ConditionType.TITLE_CONTAINS:
+            # Each needle gets its own `in` scan: CPython's substring search
+            # beats a combined regex alternation by several times, and the
+            # lowercased text is shared between conditions
+            if self.case_sensitive:
+                def check(issue: "GitHubIssue") -> bool:
+                    return value in issue.title
+            else:
+                value_lower = value.lower()
+                def check(issue: "GitHubIssue") -> bool:
+                    return value_lower in issue.title_lower
+        elif self.type == ConditionType.BODY_CONTAINS:
+            if self.case_sensitive:
+                def check(issue: "GitHubIssue") -> bool:
+                    return bool(issue.body) and value in issue.body
+            else:
+                value_lower = value.lower()
+                def check(issue: "GitHubIssue") -> bool:
+                    return value_lower in issue.body_lower
+        elif self.type == ConditionType.AUTHOR:
+            def check(issue: "GitHubIssue") -> bool:
+                return issue.user.login == value
+        elif self.type == ConditionType.ASSIGNEE:
+            def check(issue: "GitHubIssue") -> bool:
+                return issue.assignee is not None and issue.assignee.login == value
+        elif self.type in (ConditionType.CREATED_AFTER, ConditionType.UPDATED_AFTER):
+            attr = "created_at" if self.type == ConditionType.CREATED_AFTER else "updated_at"
+            try:
+                date = datetime.fromisoformat(value)
+            except ValueError as e:
+                # Fail when an issue is checked, not when the template loads
+                error = e
+                def check(issue: "GitHubIssue") -> bool:
+                    raise error
+            else:
+                def check(issue: "GitHubIssue") -> bool:
+                    return getattr(issue, attr) >= date
+        else:
+            def check(issue: "GitHubIssue") -> bool:
+                return False
+
+        if self.negate:
+            # Bound as a default so the wrapper reads a local, not a closure cell
+            def negated(issue: "GitHubIssue", check: Callable[["GitHubIssue"], bool] = check) -> bool:
+                return not check(issue)
+            return negated
+        return check
+
+
+# Template fields that determine which issues are fetched
+QUERY_FIELDS = frozenset({
+    "repositories",
+    "conditions",
+    "condition_logic",
+    "state",
+    "include_discussions",
+    "max_age_months",
+})
+
 
 class QueryTemplate(BaseModel):
     """YAML template for GitHub issue queries."""
@@ -80,29 +175,162 @@ class QueryTemplate(BaseModel):
     notes: dict[int, str] = Field(default_factory=dict)
     status_overrides: dict[int, IssueStatus] = Field(default_factory=dict)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set attribute, invalidating memoized query data if needed."""
+        super().__setattr__(name, value)
+        if name in QUERY_FIELDS:
+            self.__dict__.pop("cache_key", None)
+            self.__dict__.pop("checks", None)
+            self.__dict__.pop("matcher", None)
+
+    @cached_property
+    def cache_key(self) -> str:
+        """Hash of the fields that determine which issues are fetched."""
+        query_json = self.model_dump_json(include=QUERY_FIELDS).encode()
+        return hashlib.blake2b(query_json, digest_size=16).hexdigest()
+
+    @cached_property
+    def checks(self) -> list[Callable[["GitHubIssue"], bool]]:
+        """The template's conditions compiled into predicates, cheapest first."""
+        return compile_checks(self.conditions)
+
+    @cached_property
+    def matcher(self) -> Callable[["GitHubIssue"], bool]:
+        """Compiled form of the template's conditions (see ``compile_matcher``)."""
+        return self.compile_matcher()
+
+    def compile_matcher(self) -> Callable[["GitHubIssue"], bool]:
+        """Compile the conditions into a single issue predicate.
+        
+        Equivalent to ``issue.matches_conditions(self.conditions,
+        self.condition_logic)``, but each condition is compiled once
+        instead of per issue.
+        """
+        return _combine_checks(self.checks, self.condition_logic)
+
+    def filter_issues(self, issues: list["GitHubIssue"]) -> list["GitHubIssue"]:
+        """Return the issues matching the template's conditions, in order.
+        
+        Conditions are applied one at a time over the whole batch: with "and"
+        logic each pass only sees the survivors of the cheaper passes before
+        it, and with "or" logic only the issues nothing has matched yet.
+        """
+        if not self.checks:
+            return list(issues)
+        
+        if self.condition_logic == "or":
+            matched: set[int] = set()
+            remaining = issues
+            for check in self.checks:
+                unmatched = []
+                for issue in remaining:
+                    if check(issue):
+                        matched.add(id(issue))
+                    else:
+                        unmatched.append(issue)
+                remaining = unmatched
+            return [issue for issue in issues if id(issue) in matched]
+        
+        # filter() drives each pass from C; the first pass always copies
+        survivors = issues
+        for check in self.checks:
+            survivors = list(filter(check, survivors))
+        return survivors
+
     class Config:
         """Pydantic config."""
 
         use_enum_values = True
 
 
+# Relative cost of checking each condition type; body scans are by far the slowest
+CONDITION_COST = {
+    ConditionType.LABEL: 1,
+    ConditionType.AUTHOR: 1,
+    ConditionType.ASSIGNEE: 1,
+    ConditionType.CREATED_AFTER: 1,
+    ConditionType.UPDATED_AFTER: 1,
+    ConditionType.TITLE_CONTAINS: 2,
+    ConditionType.BODY_CONTAINS: 10,
+}
+
+
+def compile_checks(conditions: list[Condition]) -> list[Callable[["GitHubIssue"], bool]]:
+    """Compile conditions into predicates, cheapest first.
+    
+    Ordering by cost lets short-circuiting skip the expensive checks
+    (body scans) whenever possible.
+    """
+    ordered = sorted(conditions, key=lambda condition: CONDITION_COST.get(condition.type, 1))
+    return [condition.compile() for condition in ordered]
+
+
+def compile_conditions(conditions: list[Condition], logic: str = "and") -> Callable[["GitHubIssue"], bool]:
+    """Combine compiled conditions with "and" (default) or "or" logic."""
+    return _combine_checks(compile_checks(conditions), logic)
+
+
+def _combine_checks(checks: list[Callable[["GitHubIssue"], bool]], logic: str) -> Callable[["GitHubIssue"], bool]:
+    """Fold per-condition predicates into one issue predicate."""
+    if not checks:
+        return lambda issue: True
+    if len(checks) == 1:
+        return checks[0]
+    
+    # Plain loops over a tuple avoid building a generator per issue
+    checks = tuple(checks)
+    if logic == "or":
+        def match_any(issue: "GitHubIssue") -> bool:
+            for check in checks:
+                if check(issue):
+                    return True
+            return False
+        return match_any
+    
+    def match_all(issue: "GitHubIssue") -> bool:
+        for check in checks:
+            if not check(issue):
+                return False
+        return True
+    return match_all
+
+
 class GitHubUser(BaseModel):
     """GitHub user information."""
 
+    model_config = ConfigDict(frozen=True)
+
     login: str
     id: int | str  # Allow both integer and string IDs (GraphQL vs REST API)
     avatar_url: str
     html_url: str
 
+    # Logins repeat across thousands of issues; share one copy of each
+    _intern_login = field_validator("login")(sys.intern)
+
 
 class GitHubLabel(BaseModel):
     """GitHub label information."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     color: str
     description: str | None = None
 
+    _intern_name = field_validator("name")(sys.intern)
+
+
+# Memoized GitHubIssue properties derived from each field
+DERIVED_PROPERTIES = {
+    "labels": ("label_names", "label_set", "detected_type"),
+    "title": ("title_lower", "detected_type"),
+    "body": ("body_lower",),
+    "updated_at": ("updated_date",),
+    "is_discussion": ("detected_type",),
+}
+
 
 class GitHubIssue(BaseModel):
     """GitHub issue information."""
@@ -110,7 +338,7 @@ class GitHubIssue(BaseModel):
     id: int
     number: int
     title: str
-    body: str | None
+    body: str | None  # Kept even when no condition reads it: the TUI search matches it
     state: str
     html_url: str
     created_at: datetime
@@ -129,28 +357,33 @@ class GitHubIssue(BaseModel):
     custom_note: str = ""
     is_ignored: bool = False
     is_discussion: bool = False
+
+    _intern_strings = field_validator("state", "repository_name")(sys.intern)
     
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set attribute, invalidating memoized properties derived from it."""
+        super().__setattr__(name, value)
+        for prop in DERIVED_PROPERTIES.get(name, ()):
+            self.__dict__.pop(prop, None)
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        """Copy the issue, dropping memoized properties the update makes stale."""
+        copied = super().model_copy(update=update, deep=deep)
+        for name in update or ():
+            for prop in DERIVED_PROPERTIES.get(name, ()):
+                copied.__dict__.pop(prop, None)
+        return copied
+
+    @cached_property
     def detected_type(self) -> IssueType:
         """Detect the type of issue based on labels and title."""
-        # Check labels first
-        label_names_lower = [label.name.lower() for label in self.labels]
+        # Check labels first, then the title for a [type] tag
+        types = {LABEL_TYPES[name] for name in map(str.lower, self.label_names) if name in LABEL_TYPES}
+        if not types and "[" in self.title:
+            types = {TITLE_TAG_TYPES[tag] for tag in TITLE_TAG_PATTERN.findall(self.title_lower)}
         
-        if "bug" in label_names_lower:
-            return IssueType.BUG
-        if any(feat in label_names_lower for feat in ["feature", "enhancement", "feature request"]):
-            return IssueType.FEATURE
-        if "question" in label_names_lower:
-            return IssueType.QUESTION
-        
-        # Check title for [type] pattern
-        title_lower = self.title.lower()
-        if "[bug]" in title_lower:
-            return IssueType.BUG
-        if "[feature]" in title_lower or "[feat]" in title_lower:
-            return IssueType.FEATURE
-        if "[question]" in title_lower:
-            return IssueType.QUESTION
+        if types:
+            return next(issue_type for issue_type in TYPE_PRIORITY if issue_type in types)
         
         # Check if it's a discussion
         if self.is_discussion:
@@ -158,59 +391,54 @@ class GitHubIssue(BaseModel):
             
         return IssueType.ISSUE
 
-    @property
-    def label_names(self) -> list[str]:
-        """Get list of label names."""
-        return [label.name for label in self.labels]
+    @cached_property
+    def label_names(self) -> tuple[str, ...]:
+        """Get label names."""
+        return tuple(label.name for label in self.labels)
+
+    @cached_property
+    def label_set(self) -> frozenset[str]:
+        """Label names as a set, for membership checks."""
+        return frozenset(self.label_names)
+
+    @cached_property
+    def title_lower(self) -> str:
+        """Lowercased title, for case-insensitive matching."""
+        return self.title.lower()
+
+    @cached_property
+    def body_lower(self) -> str:
+        """Lowercased body (empty if there is none), for case-insensitive matching."""
+        return self.body.lower() if self.body else ""
+
+    @cached_property
+    def updated_date(self) -> str:
+        """Date of the last update as YYYY-MM-DD, for display."""
+        return self.updated_at.date().isoformat()
 
     def matches_conditions(self, conditions: list[Condition], logic: str = "and") -> bool:
         """Check if issue matches conditions using specified logic."""
-        if not conditions:
-            return True
-            
-        if logic == "or":
-            # OR logic: any condition can match
-            for condition in conditions:
-                match = self._check_condition(condition)
-                if condition.negate:
-                    match = not match
-                if match:
-                    return True
-            return False
-        else:
-            # AND logic: all conditions must match (default)
-            for condition in conditions:
-                match = self._check_condition(condition)
-                if condition.negate:
-                    match = not match
-                if not match:
-                    return False
-            return True
-
-    def _check_condition(self, condition: Condition) -> bool:
-        """Check if issue matches a single condition."""
-        if condition.type == ConditionType.LABEL:
-            return condition.value in self.label_names
-        elif condition.type == ConditionType.TITLE_CONTAINS:
-            title = self.title.lower() if not condition.case_sensitive else self.title
-            value = condition.value.lower() if not condition.case_sensitive else condition.value
-            return value in title
-        elif condition.type == ConditionType.BODY_CONTAINS:
-            if not self.body:
-                return False
-            body = self.body.lower() if not condition.case_sensitive else self.body
-            value = condition.value.lower() if not condition.case_sensitive else condition.value
-            return value in body
-        elif condition.type == ConditionType.AUTHOR:
-            return self.user.login == condition.value
-        elif condition.type == ConditionType.ASSIGNEE:
-            if not self.assignee:
-                return False
-            return self.assignee.login == condition.value
-        elif condition.type == ConditionType.CREATED_AFTER:
-            created_date = datetime.fromisoformat(condition.value)
-            return self.created_at >= created_date
-        elif condition.type == ConditionType.UPDATED_AFTER:
-            updated_date = datetime.fromisoformat(condition.value)
-            return self.updated_at >= updated_date
-        return False
\ No newline at end of file
+        return compile_conditions(conditions, logic)(self)
+
+
+def share_users_and_labels(issues: list[GitHubIssue], pool: dict[BaseModel, BaseModel] | None = None) -> None:
+    """Make equal users and labels across issues share one instance.
+    
+    Users and labels are frozen, so sharing them is safe; result sets repeat
+    a small number of authors and labels across thousands of issues. Pass the
+    same pool for issue lists that arrive in several batches.
+    """
+    if pool is None:
+        pool = {}
+    for issue in issues:
+        issue.user = pool.setdefault(issue.user, issue.user)
+        if issue.assignee is not None:
+            issue.assignee = pool.setdefault(issue.assignee, issue.assignee)
+        if issue.assignees:
+            issue.assignees = [pool.setdefault(user, user) for user in issue.assignees]
+        if issue.labels:
+            issue.labels = [pool.setdefault(label, label) for label in issue.labels]
+
+
+# Validates/serializes whole issue lists in one pydantic-core pass
+ISSUE_LIST_ADAPTER = TypeAdapter(list[GitHubIssue])
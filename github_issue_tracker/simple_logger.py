@@ -1,6 +1,9 @@
 """Dead simple logging that actually works."""
 
+import atexit
+import queue
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -12,24 +15,64 @@ class SimpleLogger:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.log_file = self.log_dir / f"github_tracker_{timestamp}.log"
         
-        # Open file in unbuffered mode so it writes immediately
-        self.file = open(self.log_file, "w", buffering=1)
+        # Lines are written by a background thread, so log() never waits on disk
+        self.file = open(self.log_file, "w", buffering=64 * 1024)
+        # Queue items: log lines, flush() events, and None to stop
+        self._queue: queue.SimpleQueue[str | threading.Event | None] = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._drain, name="simple-logger", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
         
     def log(self, message):
         """Write a log message with timestamp."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_line = f"[{timestamp}] {message}\n"
         
-        # Write to file
-        self.file.write(log_line)
-        self.file.flush()  # Force flush
+        # Hand off to the writer thread, which also mirrors it to stderr
+        self._queue.put(log_line)
+    
+    def flush(self):
+        """Block until every line logged so far has been written."""
+        if self._writer.is_alive():
+            done = threading.Event()
+            self._queue.put(done)
+            done.wait()
+    
+    def _drain(self):
+        """Write queued lines in batches until close() queues None.
         
-        # Also print to stderr so we can see it
-        print(log_line.strip(), file=sys.stderr)
+        Each batch goes out as one write per stream, so a burst of log calls
+        costs one file write and one stderr write.
+        """
+        while True:
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            lines = [item for item in items if isinstance(item, str)]
+            if lines:
+                self.file.writelines(lines)
+                self.file.flush()
+                # Also print to stderr so we can see it; Textual's stderr
+                # capture only implements write()
+                sys.stderr.write("".join(lines))
+                sys.stderr.flush()
+            
+            for item in items:
+                if isinstance(item, threading.Event):
+                    item.set()
+            if None in items:
+                return
     
-    def __del__(self):
-        """Ensure file is closed."""
-        if hasattr(self, 'file'):
+    def close(self):
+        """Write any queued lines and close the file."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        if not self.file.closed:
             self.file.close()
 
 # Global logger instance
@@ -1,10 +1,11 @@
 """Template selection screen for GitHub Issue Tracker."""
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-import yaml
+import orjson
 from rich.console import Console
 from textual import on
 from textual.app import App, ComposeResult
@@ -12,8 +13,30 @@ from textual.binding import Binding
 from textual.containers import Container
 from textual.widgets import DataTable, Footer, Header, Static
 
+from .yaml_utils import safe_load
+
 console = Console()
 
+# Threads used to read template files; reads are I/O-bound
+TEMPLATE_READ_WORKERS = 8
+
+# Normalized usage for templates that were never selected
+NEVER_USED = (datetime.min, "Never", 0)
+
+
+def _normalize_usage(usage: dict) -> tuple[datetime, str, int]:
+    """Parse a usage entry once into (last used, display text, use count)."""
+    use_count = usage.get("use_count", 0)
+    try:
+        last_used = datetime.fromisoformat(usage["last_used"])
+    except (KeyError, TypeError, ValueError):
+        return (datetime.min, "Never", use_count)
+    
+    if last_used.tzinfo is not None:
+        # Compare everything as naive local time, like datetime.now()
+        last_used = last_used.astimezone().replace(tzinfo=None)
+    return (last_used, last_used.strftime("%Y-%m-%d %H:%M"), use_count)
+
 
 class TemplateSelectorApp(App):
     """Application for selecting issue tracking templates."""
@@ -43,6 +66,17 @@ class TemplateSelectorApp(App):
         self.templates = []
         self.usage_file = Path.home() / ".config" / "gh-tracker" / "usage.json"
         self.usage_data = {}
+        # Template path -> (last used, its display text, use count)
+        self._usage_norm: dict[str, tuple[datetime, str, int]] = {}
+        # Set once a template has been chosen and usage recorded
+        self._selection_committed = False
+        # usage.json contents as last loaded or saved
+        self._usage_saved: bytes | None = None
+        # Template path -> (mtime, parsed data), so refresh only re-parses changed files
+        self._template_cache: dict[str, tuple[int, dict]] = {}
+        # Rows currently shown in the table, by template path
+        self._rendered_rows: dict[str, tuple[str, str, str, str]] = {}
+        self._columns: list = []
 
     def compose(self) -> ComposeResult:
         """Compose the app layout."""
@@ -67,7 +101,7 @@ class TemplateSelectorApp(App):
     def setup_table(self) -> None:
         """Set up the data table columns."""
         table = self.query_one("#template-table", DataTable)
-        table.add_columns(
+        self._columns = table.add_columns(
             "Template",
             "Description",
             "Repositories",
@@ -79,16 +113,29 @@ class TemplateSelectorApp(App):
         """Load usage tracking data."""
         if self.usage_file.exists():
             try:
-                with open(self.usage_file) as f:
-                    self.usage_data = json.load(f)
+                self.usage_data = orjson.loads(self.usage_file.read_bytes())
+                self._usage_saved = orjson.dumps(self.usage_data, option=orjson.OPT_INDENT_2)
             except Exception:
                 self.usage_data = {}
+        self._usage_norm = {
+            filepath: _normalize_usage(usage) for filepath, usage in self.usage_data.items()
+        }
 
     def save_usage_data(self) -> None:
-        """Save usage tracking data."""
+        """Save usage tracking data, unless it is unchanged since the last save.
+        
+        The file is written to a temp file and swapped into place, so an
+        interrupted save never leaves a truncated usage.json behind.
+        """
+        data = orjson.dumps(self.usage_data, option=orjson.OPT_INDENT_2)
+        if data == self._usage_saved:
+            return
+        
         self.usage_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.usage_file, "w") as f:
-            json.dump(self.usage_data, f, indent=2)
+        tmp_file = self.usage_file.with_name(self.usage_file.name + ".tmp")
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, self.usage_file)
+        self._usage_saved = data
 
     def load_templates(self) -> None:
         """Load all available templates."""
@@ -98,59 +145,91 @@ class TemplateSelectorApp(App):
         if not template_dir.exists():
             return
             
-        for template_file in sorted(template_dir.glob("*.yaml")):
+        # Stat and read the files concurrently, then parse them in order here
+        template_files = sorted(template_dir.glob("*.yaml"))
+        with ThreadPoolExecutor(max_workers=TEMPLATE_READ_WORKERS) as pool:
+            reads = [pool.submit(self._read_if_changed, path) for path in template_files]
+        
+        for template_file, read in zip(template_files, reads):
             try:
-                with open(template_file) as f:
-                    data = yaml.safe_load(f)
+                filepath = str(template_file)
+                mtime, raw = read.result()
+                if raw is None:
+                    self.templates.append(self._template_cache[filepath][1])
+                    continue
+                
+                data = safe_load(raw)
                 
-                # Add file path to template data
-                data["_filepath"] = str(template_file)
+                # Add file path and the truncated table description to template data
+                data["_filepath"] = filepath
+                description = data.get("description", "No description")
+                if len(description) > 50:
+                    description = description[:47] + "..."
+                data["_desc_short"] = description
+                self._template_cache[filepath] = (mtime, data)
                 self.templates.append(data)
             except Exception as e:
                 console.print(f"[red]Error loading {template_file}: {e}[/red]")
 
         # Sort by last usage (most recent first)
+        usage_norm = self._usage_norm
         self.templates.sort(
-            key=lambda t: self.usage_data.get(t["_filepath"], {}).get("last_used", ""),
+            key=lambda t: usage_norm.get(t["_filepath"], NEVER_USED)[0],
             reverse=True
         )
 
+    def _read_if_changed(self, template_file: Path) -> tuple[int, bytes | None]:
+        """Stat a template file and read it unless its cached parse is current."""
+        mtime = template_file.stat().st_mtime_ns
+        cached = self._template_cache.get(str(template_file))
+        if cached is not None and cached[0] == mtime:
+            return mtime, None
+        return mtime, template_file.read_bytes()
+
     def update_display(self) -> None:
-        """Update the display with templates."""
+        """Update the display with templates.
+        
+        Only rows that changed since the last update are touched; the table is
+        rebuilt only when the template order itself changed.
+        """
         table = self.query_one("#template-table", DataTable)
-        table.clear()
+        rows = {template["_filepath"]: self._template_row(template) for template in self.templates}
+        rendered = self._rendered_rows
         
-        for template in self.templates:
-            filepath = template["_filepath"]
-            usage = self.usage_data.get(filepath, {})
-            
-            # Format last used date
-            last_used = usage.get("last_used", "")
-            if last_used:
-                try:
-                    dt = datetime.fromisoformat(last_used)
-                    last_used_text = dt.strftime("%Y-%m-%d %H:%M")
-                except ValueError:
-                    last_used_text = "Never"
-            else:
-                last_used_text = "Never"
-            
-            # Count repositories
-            repo_count = len(template.get("repositories", []))
-            repo_text = f"{repo_count} repos"
-            
-            # Get description
-            description = template.get("description", "No description")
-            if len(description) > 50:
-                description = description[:47] + "..."
-            
-            table.add_row(
-                template.get("name", "Unnamed"),
-                description,
-                repo_text,
-                last_used_text,
-                key=filepath,
-            )
+        kept = [filepath for filepath in rendered if filepath in rows]
+        if list(rows)[:len(kept)] == kept:
+            # Kept rows are still in order and new ones only go at the end
+            for filepath in rendered.keys() - rows.keys():
+                table.remove_row(filepath)
+            for filepath, row in rows.items():
+                old_row = rendered.get(filepath)
+                if old_row is None:
+                    table.add_row(*row, key=filepath)
+                    continue
+                for column, value, old_value in zip(self._columns, row, old_row):
+                    if value != old_value:
+                        table.update_cell(filepath, column, value)
+        else:
+            table.clear()
+            for filepath, row in rows.items():
+                table.add_row(*row, key=filepath)
+        
+        self._rendered_rows = rows
+
+    def _template_row(self, template: dict) -> tuple[str, str, str, str]:
+        """Build the table cells for one template."""
+        last_used_text = self._usage_norm.get(template["_filepath"], NEVER_USED)[1]
+        
+        # Count repositories
+        repo_count = len(template.get("repositories", []))
+        repo_text = f"{repo_count} repos"
+        
+        return (
+            template.get("name", "Unnamed"),
+            template["_desc_short"],
+            repo_text,
+            last_used_text,
+        )
 
     def get_selected_template(self) -> str | None:
         """Get the currently selected template filepath."""
@@ -167,39 +246,41 @@ class TemplateSelectorApp(App):
     def action_select(self) -> None:
         """Select the current template and launch tracker."""
         template_path = self.get_selected_template()
-        if not template_path:
+        if template_path:
+            self._commit_selection(template_path)
+
+    def action_refresh(self) -> None:
+        """Refresh the template list."""
+        self.load_templates()
+        self.update_display()
+
+    @on(DataTable.RowSelected)
+    def on_datatable_row_selected(self, event) -> None:
+        """Handle row selection by double-click or Enter."""
+        if event.row_key and event.row_key.value:
+            self._commit_selection(event.row_key.value)
+
+    def _commit_selection(self, template_path: str) -> None:
+        """Record usage for the chosen template and exit with it.
+        
+        Enter can trigger both the select binding and RowSelected, so only
+        the first call counts.
+        """
+        if self._selection_committed:
             return
+        self._selection_committed = True
         
         # Update usage data
         self.usage_data[template_path] = {
             "last_used": datetime.now().isoformat(),
             "use_count": self.usage_data.get(template_path, {}).get("use_count", 0) + 1
         }
+        self._usage_norm[template_path] = _normalize_usage(self.usage_data[template_path])
         self.save_usage_data()
         
         # Exit and return selected template
         self.exit(result=template_path)
 
-    def action_refresh(self) -> None:
-        """Refresh the template list."""
-        self.load_templates()
-        self.update_display()
-
-    @on(DataTable.RowSelected)
-    def on_datatable_row_selected(self, event) -> None:
-        """Handle row selection by double-click or Enter."""
-        if event.row_key and event.row_key.value:
-            # Update usage data
-            template_path = event.row_key.value
-            self.usage_data[template_path] = {
-                "last_used": datetime.now().isoformat(),
-                "use_count": self.usage_data.get(template_path, {}).get("use_count", 0) + 1
-            }
-            self.save_usage_data()
-            
-            # Exit and return selected template
-            self.exit(result=template_path)
-
 
 def run_template_selector() -> str | None:
     """Run the template selector and return selected template path."""
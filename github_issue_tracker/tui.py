@@ -1,19 +1,23 @@
 """Terminal User Interface for GitHub Issue Tracker."""
 
-import re
+import asyncio
+import threading
 import time
 import webbrowser
+from collections.abc import Sequence
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
-import yaml
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process
 from rich.text import Text
 from textual import on
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     DataTable,
@@ -25,12 +29,20 @@ from textual.widgets import (
     Static,
     TextArea,
 )
+from textual.widgets.data_table import ColumnKey
 
 from .filter_config import FilterConfigModal
-from .github_client import GitHubClient
+from .github_client import REPO_CONCURRENCY, GitHubClient
 from .models import GitHubIssue, IssueStatus, IssueType, QueryTemplate
 from enum import Enum
 from .simple_logger import log
+from .yaml_utils import safe_dump, safe_load
+
+
+# Seconds of quiet before filter text is applied, so bursts of input scan once
+FILTER_DEBOUNCE = 0.15
+# Seconds of quiet before edits are written, so rapid toggles save once
+AUTO_SAVE_DEBOUNCE = 0.5
 
 
 class SortColumn(Enum):
@@ -43,32 +55,99 @@ class SortColumn(Enum):
     UPDATED = "updated"
 
 
+# Sort key per column; attrgetter walks the (dotted) attributes in C
+SORT_KEYS = {
+    SortColumn.STATUS: attrgetter("custom_status.value", "updated_at"),
+    SortColumn.TYPE: attrgetter("detected_type.value", "updated_at"),
+    SortColumn.NUMBER: attrgetter("number"),
+    SortColumn.REPO: attrgetter("repository_name", "updated_at"),
+    SortColumn.TITLE: attrgetter("title_lower"),
+    SortColumn.UPDATED: attrgetter("updated_at"),
+}
+
+
+
+def _cycle(members: list) -> dict:
+    """Map each member to the one after it, wrapping around at the end."""
+    return dict(zip(members, members[1:] + members[:1]))
+
+
+# Next status / sort column for the cycling bindings
+STATUS_CYCLE: dict[IssueStatus, IssueStatus] = _cycle(list(IssueStatus))
+SORT_CYCLE: dict[SortColumn, SortColumn] = _cycle(list(SortColumn))
+
+# Cell text per status and type, built once and shared by every row; never stylize these
+STATUS_TEXT: dict[IssueStatus, Text] = {
+    status: Text(text, style=color)
+    for status, (text, color) in {
+        IssueStatus.NONE: ("", "white"),
+        IssueStatus.IN_PROGRESS: ("🔄 Progress", "yellow"),
+        IssueStatus.BLOCKED: ("🚫 Blocked", "red"),
+        IssueStatus.FUTURE: ("📅 Future", "dim blue"),
+        IssueStatus.INVESTIGATING: ("🔍 Investigating", "cyan"),
+        IssueStatus.READY: ("✅ Ready", "green"),
+        IssueStatus.WAITING: ("⏳ Waiting", "magenta"),
+        IssueStatus.DONE: ("✔️  Done", "dim green"),
+        IssueStatus.HELP_WANTED_OS: ("🆘 Help: OS", "bright_yellow"),
+        IssueStatus.HELP_WANTED_TEAM: ("🆘 Help: Team", "bright_magenta"),
+    }.items()
+}
+
+TYPE_TEXT: dict[IssueType, Text] = {
+    issue_type: Text(text, style=color)
+    for issue_type, (text, color) in {
+        IssueType.BUG: ("🐛 Bug", "red"),
+        IssueType.FEATURE: ("✨ Feature", "cyan"),
+        IssueType.QUESTION: ("❓ Question", "yellow"),
+        IssueType.DISCUSSION: ("💬 Discuss", "magenta"),
+        IssueType.ISSUE: ("📋 Issue", "white"),
+    }.items()
+}
+
+
+class _PunctuationTable(dict):
+    """str.translate table deleting everything but word characters and whitespace.
+    
+    Entries are filled in on first lookup, so only characters that actually
+    occur are ever classified.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        char = chr(codepoint)
+        keep = char.isalnum() or char == "_" or char.isspace()
+        self[codepoint] = result = codepoint if keep else None
+        return result
+
+
+PUNCTUATION_TABLE = _PunctuationTable()
+
+
 def normalize_text(text: str) -> str:
     """Normalize text for fuzzy matching."""
-    # Convert to lowercase
-    text = text.lower()
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
-    # Remove special characters except spaces
-    text = re.sub(r'[^\w\s]', '', text)
-    return text
+    # Lowercase, collapse whitespace runs to single spaces, then drop
+    # special characters, all in C-level str methods
+    return " ".join(text.lower().split()).translate(PUNCTUATION_TABLE)
 
 
-def fuzzy_match(query: str, target: str, threshold: int = 70) -> bool:
-    """Check if query fuzzy matches target text."""
+def fuzzy_match(query: str, target: str, threshold: int = 70, pre_normalized_target: bool = False) -> bool:
+    """Check if query fuzzy matches target text.
+    
+    Pass pre_normalized_target=True when target already went through
+    normalize_text, so it is not normalized again.
+    """
     if not query or not target:
         return False
     
     # Normalize both strings
     norm_query = normalize_text(query)
-    norm_target = normalize_text(target)
+    norm_target = target if pre_normalized_target else normalize_text(target)
     
     # Direct substring match (highest priority)
     if norm_query in norm_target:
         return True
     
-    # Fuzzy ratio match
-    ratio = fuzz.partial_ratio(norm_query, norm_target)
+    # Fuzzy ratio match; the cutoff lets rapidfuzz stop early on hopeless targets
+    ratio = fuzz.partial_ratio(norm_query, norm_target, score_cutoff=threshold)
     return ratio >= threshold
 
 
@@ -222,11 +301,24 @@ class IssueTrackerApp(App):
         Binding("t", "cycle_sort", "Cycle Sort"),
     ]
 
-    def __init__(self, template_path: str):
-        """Initialize the app with a template."""
+    def __init__(
+        self,
+        template_path: str,
+        template: QueryTemplate | None = None,
+        max_concurrency: int = REPO_CONCURRENCY,
+    ):
+        """Initialize the app with a template.
+        
+        Args:
+            template_path: YAML template file, also where changes are saved
+            template: The template already parsed from template_path, if the
+                      caller has it; load_template then skips re-reading the file
+            max_concurrency: Maximum number of repositories fetched at once
+        """
         super().__init__()
         self.template_path = Path(template_path)
-        self.template: QueryTemplate | None = None
+        self.template: QueryTemplate | None = template
+        self.max_concurrency = max_concurrency
         self.issues: list[GitHubIssue] = []
         self.filtered_issues: list[GitHubIssue] = []
         self.show_hidden = False
@@ -234,6 +326,34 @@ class IssueTrackerApp(App):
         self.is_loading = True
         self.current_sort = SortColumn.UPDATED  # Default sort by updated date
         self.sort_reverse = True  # Default to newest first
+        self._filter_debounce: Timer | None = None
+        # What filtered_issues was last computed from, so repeat calls are free
+        self._filter_dirty = True
+        self._filtered_from: list[GitHubIssue] | None = None
+        self._filtered_inputs: tuple | None = None
+        # Kept for the app's lifetime so refreshes reuse its pooled connections
+        self._client: GitHubClient | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._save_debounce: Timer | None = None
+        # Snapshots are numbered so a slow worker never overwrites a newer save
+        self._save_lock = threading.Lock()
+        self._save_count = 0
+        self._saved_number = 0
+        self._column_keys: list[ColumnKey] = []
+        # Row key -> (issue, (status, note, ignored), cells) for each row in the table
+        self._shown_rows: dict[str, tuple[GitHubIssue, tuple, tuple]] = {}
+        # The same entries for every issue drawn since self.issues was last replaced,
+        # so rebuilding the table reuses cells instead of reformatting them
+        self._row_cache: dict[str, tuple[GitHubIssue, tuple, tuple]] = {}
+        self._row_cache_for: list[GitHubIssue] | None = None
+        # Normalized search fields as (threshold, strings, owning issue index per string),
+        # rebuilt only when self.issues is replaced
+        self._search_fields: list[tuple[int, list[str], Sequence[int]]] = []
+        self._search_indexed: list[GitHubIssue] | None = None
+        self._issues_by_number: dict[str, list[int]] = {}
+        self._sorted_order: list[int] = []
+        self._sorted_for: list[GitHubIssue] | None = None
+        self._sorted_by: tuple[SortColumn, bool] | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the app layout."""
@@ -261,7 +381,7 @@ class IssueTrackerApp(App):
         loading_label = self.query_one("#loading-container Label", Label)
         loading_label.update("Loading template...")
         
-        await self.load_template()
+        await self.load_and_prepare()
         log(f"Template loaded: {self.template.name if self.template else 'None'}")
         
         self.setup_table()
@@ -269,31 +389,50 @@ class IssueTrackerApp(App):
         # Update loading message for fetching
         loading_label.update(f"Fetching issues from {len(self.template.repositories)} repositories...")
         
-        # Load from cache if available, otherwise fetch fresh
+        # Load from cache if available, otherwise fetch fresh. The fetch runs
+        # in the background so key bindings work while it is in flight.
         log("Starting initial refresh (will use cache if available)...")
-        await self.refresh_issues(force_refresh=False)
-        
-        # Hide loading and show main content
-        self.query_one("#loading-container").add_class("hidden")
-        self.query_one("#main-container").remove_class("hidden")
-        self.is_loading = False
-        
-        log(f"After initial fetch: {len(self.issues)} issues, {len(self.filtered_issues)} filtered")
-        
-        self.update_display()
+        self.start_refresh()
         log("=== App on_mount completed ===")
 
+    async def load_and_prepare(self) -> None:
+        """Load the template while the GitHub client is set up in a thread."""
+        async with asyncio.TaskGroup() as tg:
+            # Started first so its thread runs while the template is parsed
+            tg.create_task(self.prepare_fetch())
+            tg.create_task(self.load_template())
+
+    async def prepare_fetch(self) -> None:
+        """Create the GitHub client ahead of the first refresh.
+        
+        Construction finds the token (possibly by running gh) and opens the
+        disk cache, so it runs in a thread to keep the event loop free.
+        """
+        if self._client is None:
+            self._client = await asyncio.to_thread(self._new_client)
+
+    async def close_client(self) -> None:
+        """Close the GitHub client, if one was created."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def _new_client(self) -> GitHubClient:
+        """Create a GitHub client with this app's concurrency bound."""
+        return GitHubClient(repo_concurrency=self.max_concurrency)
+
     async def load_template(self) -> None:
-        """Load the query template from YAML file."""
-        with open(self.template_path) as f:
-            data = yaml.safe_load(f)
-        self.template = QueryTemplate(**data)
+        """Load the query template from YAML file, unless it was passed in."""
+        if self.template is None:
+            # Read off the event loop; parsing a template is quick
+            raw = await asyncio.to_thread(self.template_path.read_bytes)
+            self.template = QueryTemplate(**safe_load(raw))
         self.title = f"GitHub Issue Tracker - {self.template.name}"
 
     def setup_table(self) -> None:
         """Set up the data table columns."""
         table = self.query_one("#issue-table", DataTable)
-        table.add_columns(
+        self._column_keys = table.add_columns(
             "Status",
             "Type",
             "#",
@@ -305,8 +444,50 @@ class IssueTrackerApp(App):
         )
         table.cursor_type = "row"
 
+    def start_refresh(self, force_refresh: bool = False) -> asyncio.Task[None]:
+        """Refresh issues in the background and return the task.
+        
+        The table is redrawn as issues arrive. A refresh that is still
+        running is cancelled, so the latest request wins.
+        """
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        self._refresh_task = asyncio.create_task(self._refresh_and_show(force_refresh))
+        return self._refresh_task
+
+    async def _refresh_and_show(self, force_refresh: bool) -> None:
+        """Run refresh_issues, then show the final results."""
+        await self.refresh_issues(force_refresh)
+        self._show_issues()
+
+    def _show_issues(self) -> None:
+        """Filter the issues and, if the app is running, redraw the table."""
+        self.apply_filter()
+        if not self.is_running:
+            return
+        if self.is_loading:
+            # Hide loading and show main content
+            self.query_one("#loading-container").add_class("hidden")
+            self.query_one("#main-container").remove_class("hidden")
+            self.is_loading = False
+            log(f"First issues shown: {len(self.issues)} issues, {len(self.filtered_issues)} filtered")
+        self.update_display()
+
+    def _set_stats(self, text: str) -> None:
+        """Show text in the stats bar, if the app is running."""
+        if self.is_running:
+            self.query_one("#stats", Static).update(text)
+
     async def refresh_issues(self, force_refresh: bool = False) -> None:
-        """Fetch issues from GitHub."""
+        """Fetch issues from GitHub.
+        
+        Without force_refresh the client serves the template's disk cache.
+        With a token, the issues of several repositories are fetched per
+        GraphQL request. Without one (or when GraphQL fails) issues come from
+        the REST API, whose pages are revalidated with their stored ETags so
+        unchanged pages come back as 304s that do not count against the rate
+        limit. The table is updated as each repository's issues arrive.
+        """
         log(f"refresh_issues called with force_refresh={force_refresh}")
         if not self.template:
             log("ERROR: No template!")
@@ -315,21 +496,24 @@ class IssueTrackerApp(App):
         try:
             # Show fetching status
             if force_refresh:
-                self.query_one("#stats", Static).update(
+                self._set_stats(
                     f"[yellow bold]FORCE REFRESHING from API (ignoring cache)... Please wait...[/yellow bold]"
                 )
             else:
-                self.query_one("#stats", Static).update(
+                self._set_stats(
                     f"[cyan]Refreshing issues from {len(self.template.repositories)} repositories (using cache if available)...[/cyan]"
                 )
             
-            # Force UI update
-            self.refresh()
-            
             log(f"About to fetch issues from {len(self.template.repositories)} repos")
             start_time = time.time()
-            async with GitHubClient() as client:
-                self.issues = await client.fetch_all_issues_with_progress(self.template, force_refresh)
+            if self._client is None:
+                self._client = self._new_client()
+            issues: list[GitHubIssue] = []
+            async for issues in self._client.iter_issues_async(self.template, force_refresh=force_refresh):
+                # Each batch is a new list, so the filter and sort caches see the change
+                self.issues = issues
+                self._show_issues()
+            self.issues = issues
             
             elapsed = time.time() - start_time
             log(f"Fetch complete. Got {len(self.issues)} issues in {elapsed:.1f}s")
@@ -337,12 +521,12 @@ class IssueTrackerApp(App):
             source = "fresh API data" if force_refresh else "cache/API"
             
             if self.issues:
-                self.query_one("#stats", Static).update(
+                self._set_stats(
                     f"[green]Loaded {len(self.issues)} issues from {source} in {elapsed:.1f}s[/green]"
                 )
             else:
                 # If no issues, it might be rate limited or no results
-                self.query_one("#stats", Static).update(
+                self._set_stats(
                     f"[yellow]No issues found after filtering. Fetched from {len(self.template.repositories)} repos. Check conditions or logs.[/yellow]"
                 )
             
@@ -356,127 +540,167 @@ class IssueTrackerApp(App):
             
             error_msg = str(e)
             if "403" in error_msg or "rate limit" in error_msg.lower():
-                self.query_one("#stats", Static).update(
+                self._set_stats(
                     f"[red]GitHub API rate limit exceeded. Make sure you're authenticated with 'gh auth login'[/red]"
                 )
             else:
                 # Escape error message to prevent markup issues
                 error_msg_escaped = str(e).replace("[", "\\[").replace("]", "\\]")
-                self.query_one("#stats", Static).update(f"[red]Error fetching issues: {error_msg_escaped}[/red]")
+                self._set_stats(f"[red]Error fetching issues: {error_msg_escaped}[/red]")
             self.issues = []
             self.filtered_issues = []
 
     def apply_filter(self) -> None:
-        """Apply current filter to issues with fuzzy matching."""
-        filtered = self.issues if self.show_hidden else [i for i in self.issues if not i.is_ignored]
+        """Apply current filter to issues with fuzzy matching.
+        
+        Does nothing if the issues, filter text, hidden toggle and sort are the
+        same as last time; in-place edits that change the result must set
+        _filter_dirty first.
+        """
+        issues = self.issues
+        inputs = (self.filter_text, self.show_hidden, self.current_sort, self.sort_reverse)
+        if not self._filter_dirty and self._filtered_from is issues and self._filtered_inputs == inputs:
+            return
+        self._filter_dirty = False
+        self._filtered_from = issues
+        self._filtered_inputs = inputs
+        
+        # Filtering keeps the sorted order, so issues are sorted once per sort change
+        order = self._sort_order()
         
         if self.filter_text:
-            query = self.filter_text.strip()
-            filtered = [
-                i for i in filtered
-                if self._matches_search_query(i, query)
-            ]
-        
-        # Apply sorting
-        self.filtered_issues = self._sort_issues(filtered)
+            matched = self._search(self.filter_text.strip())
+            order = [n for n in order if n in matched]
+        
+        filtered = [issues[n] for n in order]
+        if not self.show_hidden:
+            filtered = [i for i in filtered if not i.is_ignored]
+        
+        self.filtered_issues = filtered
     
-    def _matches_search_query(self, issue: GitHubIssue, query: str) -> bool:
-        """Check if issue matches search query using fuzzy matching."""
-        # Exact number match (highest priority)
-        if query.isdigit() and str(issue.number) == query:
-            return True
+    def _build_search_index(self) -> None:
+        """Normalize the searchable fields of every issue once per issue list."""
+        issues = self.issues
+        one_per_issue = range(len(issues))
+        # Cheapest fields first: short strings settle most issues before bodies are scored
+        self._search_fields = [
+            (70, [normalize_text(i.repository_name) for i in issues], one_per_issue),
+            (60, [normalize_text(i.title) for i in issues], one_per_issue),
+            (
+                75,
+                [normalize_text(label.name) for i in issues for label in i.labels],
+                [n for n, i in enumerate(issues) for _ in i.labels],
+            ),
+            (80, [normalize_text(i.user.login) for i in issues], one_per_issue),
+            # Lower threshold for bodies; issues without one never match here
+            (50, [normalize_text(i.body) if i.body else "" for i in issues], one_per_issue),
+        ]
+        self._issues_by_number = {}
+        for n, issue in enumerate(issues):
+            self._issues_by_number.setdefault(str(issue.number), []).append(n)
+        self._search_indexed = issues
+    
+    def _search(self, query: str) -> set[int]:
+        """Return indices into self.issues of issues fuzzy matching the query.
         
-        # Fuzzy match against title (most important)
-        if fuzzy_match(query, issue.title, threshold=60):
-            return True
+        Each field is scored in one rapidfuzz call, so the per-issue loop runs
+        in C++ rather than Python. Issues that already matched are left out of
+        later fields, and plain title substrings skip scoring entirely.
+        """
+        if self._search_indexed is not self.issues:
+            self._build_search_index()
         
-        # Fuzzy match against repository name
-        if fuzzy_match(query, issue.repository_name, threshold=70):
-            return True
+        matched: set[int] = set()
         
-        # Fuzzy match against labels
-        for label in issue.labels:
-            if fuzzy_match(query, label.name, threshold=75):
-                return True
+        # Exact number match, looked up rather than scanned
+        matched.update(self._issues_by_number.get(query, ()))
         
-        # Fuzzy match against body (if available, lower threshold)
-        if issue.body and fuzzy_match(query, issue.body, threshold=50):
-            return True
+        norm_query = normalize_text(query)
+        if not norm_query:
+            # Nothing left to score once punctuation is stripped
+            return set(range(len(self.issues)))
         
-        # Fuzzy match against author name
-        if fuzzy_match(query, issue.user.login, threshold=80):
-            return True
+        # Typed text is usually part of a title; a substring check settles those
+        query_lower = query.lower()
+        matched.update(n for n, issue in enumerate(self.issues) if query_lower in issue.title_lower)
         
-        return False
+        # A substring scores 100 with partial_ratio, so it always passes the threshold
+        for threshold, choices, owners in self._search_fields:
+            pending = choices
+            if matched:
+                pending = {k: choice for k, choice in enumerate(choices) if owners[k] not in matched}
+            hits = process.extract(
+                norm_query, pending, scorer=fuzz.partial_ratio,
+                limit=None, score_cutoff=threshold,
+            )
+            matched.update(owners[k] for _, _, k in hits)
+        
+        return matched
 
-    def _sort_issues(self, issues: list[GitHubIssue]) -> list[GitHubIssue]:
-        """Sort issues based on current sort column."""
-        if self.current_sort == SortColumn.STATUS:
-            key_func = lambda x: (x.custom_status.value, x.updated_at)
-        elif self.current_sort == SortColumn.TYPE:
-            key_func = lambda x: (x.detected_type.value, x.updated_at)
-        elif self.current_sort == SortColumn.NUMBER:
-            key_func = lambda x: x.number
-        elif self.current_sort == SortColumn.REPO:
-            key_func = lambda x: (x.repository_name, x.updated_at)
-        elif self.current_sort == SortColumn.TITLE:
-            key_func = lambda x: x.title.lower()
-        elif self.current_sort == SortColumn.UPDATED:
-            key_func = lambda x: x.updated_at
-        else:
-            key_func = lambda x: x.updated_at
+    def _sort_order(self) -> list[int]:
+        """Indices into self.issues in the current sort order.
         
-        return sorted(issues, key=key_func, reverse=self.sort_reverse)
+        The order is reused until the issues, sort column or direction change.
+        Status sorts are always redone since statuses are edited in place.
+        """
+        sort_key = (self.current_sort, self.sort_reverse)
+        if (
+            self._sorted_for is not self.issues
+            or self._sorted_by != sort_key
+            or self.current_sort == SortColumn.STATUS
+        ):
+            issues = self.issues
+            key_func = SORT_KEYS[self.current_sort]
+            self._sorted_order = sorted(
+                range(len(issues)), key=lambda n: key_func(issues[n]), reverse=self.sort_reverse
+            )
+            self._sorted_for = issues
+            self._sorted_by = sort_key
+        return self._sorted_order
 
     def update_display(self) -> None:
-        """Update the display with current issues."""
+        """Update the display with current issues.
+        
+        Rows are diffed against what the table already shows: removed rows are
+        dropped, and only cells of rows whose status, note or ignored flag
+        changed are rewritten. The table is rebuilt only when rows are added
+        or reordered, and then from cached cells where the row is unchanged.
+        """
         table = self.query_one("#issue-table", DataTable)
         
         # Save current cursor position
         current_row = table.cursor_coordinate.row if table.cursor_coordinate else 0
         
-        table.clear()
+        displayed = self._shown_rows
+        keys = [str(issue.id) for issue in self.filtered_issues]
+        if keys != list(displayed):
+            key_set = set(keys)
+            if [key for key in displayed if key in key_set] == keys:
+                # Only removals: the remaining rows are already in order
+                for key in [key for key in displayed if key not in key_set]:
+                    table.remove_row(key)
+                    del displayed[key]
+            else:
+                table.clear()
+                displayed.clear()
         
-        for issue in self.filtered_issues:
-            status_text = self._get_status_display(issue)
-            type_text = self._get_type_display(issue)
-            
-            # Truncate title to 80 characters
-            truncated_title = issue.title[:80] + "..." if len(issue.title) > 80 else issue.title
-            title_text = Text(truncated_title)
-            
-            # Style based on status
-            if issue.custom_status == IssueStatus.FUTURE:
-                title_text.stylize("dim")
-            elif issue.custom_status == IssueStatus.DONE:
-                title_text.stylize("dim italic")
-            
-            if issue.is_ignored:
-                title_text.stylize("dim strike")
-            
-            # Add state indicator for closed issues
-            if issue.state == "closed":
-                title_text = Text("✓ ", style="green") + title_text
-                
-            labels = ", ".join(issue.label_names)
-            updated = issue.updated_at.strftime("%Y-%m-%d")
-            
-            # Format note text
-            note_text = Text(issue.custom_note[:30] + "..." if issue.custom_note and len(issue.custom_note) > 30 else issue.custom_note or "")
-            if issue.custom_note:
-                note_text.stylize("italic cyan")
+        if self._row_cache_for is not self.issues:
+            self._row_cache = {}
+            self._row_cache_for = self.issues
+        
+        for key, issue in zip(keys, self.filtered_issues):
+            entry = self._cached_row(key, issue)
+            row = displayed.get(key)
+            if row is entry:
+                continue
             
-            table.add_row(
-                status_text,
-                type_text,
-                str(issue.number),
-                issue.repository_name,
-                title_text,
-                note_text,
-                labels,
-                updated,
-                key=str(issue.id),
-            )
+            if row is None:
+                table.add_row(*entry[2], key=key)
+            else:
+                for column_key, old, new in zip(self._column_keys, row[2], entry[2]):
+                    if old != new:
+                        table.update_cell(key, column_key, new, update_width=True)
+            displayed[key] = entry
         
         # Update stats
         total = len(self.issues)
@@ -498,36 +722,61 @@ class IssueTrackerApp(App):
         if shown > 0 and current_row < shown:
             table.cursor_coordinate = (current_row, 0)
 
+    def _cached_row(self, key: str, issue: GitHubIssue) -> tuple[GitHubIssue, tuple, tuple]:
+        """Get the row cache entry for an issue, rebuilding its cells if it changed."""
+        state = (issue.custom_status, issue.custom_note, issue.is_ignored)
+        entry = self._row_cache.get(key)
+        if entry is None or entry[0] is not issue or entry[1] != state:
+            entry = self._row_cache[key] = (issue, state, self._row_cells(issue))
+        return entry
+
+    def _row_cells(self, issue: GitHubIssue) -> tuple:
+        """Build the table cells for an issue."""
+        status_text = self._get_status_display(issue)
+        type_text = self._get_type_display(issue)
+        
+        # Truncate title to 80 characters
+        truncated_title = issue.title[:80] + "..." if len(issue.title) > 80 else issue.title
+        title_text = Text(truncated_title)
+        
+        # Style based on status
+        if issue.custom_status == IssueStatus.FUTURE:
+            title_text.stylize("dim")
+        elif issue.custom_status == IssueStatus.DONE:
+            title_text.stylize("dim italic")
+        
+        if issue.is_ignored:
+            title_text.stylize("dim strike")
+        
+        # Add state indicator for closed issues
+        if issue.state == "closed":
+            title_text = Text("✓ ", style="green") + title_text
+            
+        labels = ", ".join(issue.label_names)
+        
+        # Format note text
+        note_text = Text(issue.custom_note[:30] + "..." if issue.custom_note and len(issue.custom_note) > 30 else issue.custom_note or "")
+        if issue.custom_note:
+            note_text.stylize("italic cyan")
+        
+        return (
+            status_text,
+            type_text,
+            str(issue.number),
+            issue.repository_name,
+            title_text,
+            note_text,
+            labels,
+            issue.updated_date,
+        )
+
     def _get_status_display(self, issue: GitHubIssue) -> Text:
         """Get formatted status display for an issue."""
-        status_map = {
-            IssueStatus.NONE: ("", "white"),
-            IssueStatus.IN_PROGRESS: ("🔄 Progress", "yellow"),
-            IssueStatus.BLOCKED: ("🚫 Blocked", "red"),
-            IssueStatus.FUTURE: ("📅 Future", "dim blue"),
-            IssueStatus.INVESTIGATING: ("🔍 Investigating", "cyan"),
-            IssueStatus.READY: ("✅ Ready", "green"),
-            IssueStatus.WAITING: ("⏳ Waiting", "magenta"),
-            IssueStatus.DONE: ("✔️  Done", "dim green"),
-            IssueStatus.HELP_WANTED_OS: ("🆘 Help: OS", "bright_yellow"),
-            IssueStatus.HELP_WANTED_TEAM: ("🆘 Help: Team", "bright_magenta"),
-        }
-        
-        text, color = status_map[issue.custom_status]
-        return Text(text, style=color)
+        return STATUS_TEXT[issue.custom_status]
 
     def _get_type_display(self, issue: GitHubIssue) -> Text:
         """Get formatted type display for an issue."""
-        type_map = {
-            IssueType.BUG: ("🐛 Bug", "red"),
-            IssueType.FEATURE: ("✨ Feature", "cyan"),
-            IssueType.QUESTION: ("❓ Question", "yellow"),
-            IssueType.DISCUSSION: ("💬 Discuss", "magenta"),
-            IssueType.ISSUE: ("📋 Issue", "white"),
-        }
-        
-        text, color = type_map[issue.detected_type]
-        return Text(text, style=color)
+        return TYPE_TEXT[issue.detected_type]
 
     def get_current_issue(self) -> GitHubIssue | None:
         """Get the currently selected issue."""
@@ -538,24 +787,20 @@ class IssueTrackerApp(App):
         row_key = table.coordinate_to_cell_key(table.cursor_coordinate).row_key
         if row_key is None or row_key.value is None:
             return None
-        issue_id = int(row_key.value)
         
-        for issue in self.filtered_issues:
-            if issue.id == issue_id:
-                return issue
-        return None
+        # The rows the table shows are already indexed by row key
+        row = self._shown_rows.get(row_key.value)
+        return row[0] if row is not None else None
 
-    async def action_refresh_cached(self) -> None:
+    def action_refresh_cached(self) -> None:
         """Refresh issues from GitHub (use cache if available)."""
-        await self.refresh_issues(force_refresh=False)
-        self.update_display()
+        self.start_refresh(force_refresh=False)
     
-    async def action_refresh_force(self) -> None:
+    def action_refresh_force(self) -> None:
         """Force refresh issues from GitHub (ignore cache)."""
         log("action_refresh_force called!")
         self.notify("Force refresh triggered!")
-        await self.refresh_issues(force_refresh=True)
-        self.update_display()
+        self.start_refresh(force_refresh=True)
 
     def action_open_issue(self) -> None:
         """Open current issue in browser."""
@@ -600,9 +845,10 @@ class IssueTrackerApp(App):
             if issue.number in self.template.ignored_issues:
                 self.template.ignored_issues.remove(issue.number)
         
+        self._filter_dirty = True
         self.apply_filter()
         self.update_display()
-        self._auto_save()
+        self._schedule_save()
 
     def action_cycle_status(self) -> None:
         """Cycle through status options for current issue."""
@@ -610,10 +856,7 @@ class IssueTrackerApp(App):
         if not issue or not self.template:
             return
         
-        statuses = list(IssueStatus)
-        current_idx = statuses.index(issue.custom_status)
-        next_idx = (current_idx + 1) % len(statuses)
-        issue.custom_status = statuses[next_idx]
+        issue.custom_status = STATUS_CYCLE[issue.custom_status]
         
         if issue.custom_status == IssueStatus.NONE:
             self.template.status_overrides.pop(issue.number, None)
@@ -622,7 +865,7 @@ class IssueTrackerApp(App):
             self.template.status_overrides[issue.number] = issue.custom_status.value
         
         self.update_display()
-        self._auto_save()
+        self._schedule_save()
 
     async def action_edit_note(self) -> None:
         """Edit note for current issue."""
@@ -644,7 +887,7 @@ class IssueTrackerApp(App):
                 self.template.notes.pop(issue.number, None)
             
             self.update_display()
-            self._auto_save()
+            self._schedule_save()
             delattr(self, '_current_issue_for_note')
 
     async def action_filter(self) -> None:
@@ -655,39 +898,104 @@ class IssueTrackerApp(App):
         """Handle filter modal result."""
         if result is not None:
             self.filter_text = result
-            self.apply_filter()
-            self.update_display()
+            self._schedule_filter()
+    
+    def _schedule_filter(self) -> None:
+        """Re-filter once no new filter text has arrived for FILTER_DEBOUNCE seconds."""
+        if self._filter_debounce is not None:
+            self._filter_debounce.stop()
+        self._filter_debounce = self.set_timer(FILTER_DEBOUNCE, self._do_filter)
+    
+    def _do_filter(self) -> None:
+        """Apply the pending filter text and redraw."""
+        self._filter_debounce = None
+        self.apply_filter()
+        self.update_display()
 
+    def _schedule_save(self) -> None:
+        """Auto-save once no further edit has arrived for AUTO_SAVE_DEBOUNCE seconds."""
+        if self._save_debounce is not None:
+            self._save_debounce.stop()
+        self._save_debounce = self.set_timer(AUTO_SAVE_DEBOUNCE, self._auto_save)
+    
+    async def on_unmount(self) -> None:
+        """Write any edits still waiting on the auto-save timer, then close the client.
+        
+        Workers are cancelled on exit, so this last save runs inline.
+        """
+        if self._save_debounce is not None:
+            self._save_debounce.stop()
+            self._save_debounce = None
+            snapshot = self._template_snapshot()
+            if snapshot is not None:
+                try:
+                    self._write_template(*snapshot)
+                except Exception as e:
+                    log(f"Failed to auto-save: {e}")
+        # A refresh still in flight has nowhere to show its results
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        await self.close_client()
+    
     def _auto_save(self) -> None:
-        """Auto-save current state to YAML file."""
+        """Auto-save current state to YAML file.
+        
+        The template is snapshotted here on the UI thread; serializing and
+        writing it happen in a worker thread so the UI never waits on disk.
+        """
+        if self._save_debounce is not None:
+            self._save_debounce.stop()
+            self._save_debounce = None
+        
+        snapshot = self._template_snapshot()
+        if snapshot is not None:
+            self.run_worker(
+                partial(self._save_in_background, *snapshot),
+                thread=True, exclusive=True, group="save",
+            )
+    
+    def _template_snapshot(self) -> tuple[int, dict[str, Any]] | None:
+        """Dump the template to plain YAML-safe data, tagged with a save number."""
         if not self.template:
-            return
+            return None
         
-        try:
-            # Convert template to dict for YAML serialization
-            data = self.template.model_dump()
-            
-            # Convert all enum values to strings to avoid Python-specific tags
-            if "status_overrides" in data and data["status_overrides"]:
-                data["status_overrides"] = {
-                    k: v.value if hasattr(v, 'value') else str(v)
-                    for k, v in data["status_overrides"].items()
-                }
-            
-            # Convert condition types to strings
-            if "conditions" in data and data["conditions"]:
-                for condition in data["conditions"]:
-                    if "type" in condition and hasattr(condition["type"], "value"):
-                        condition["type"] = condition["type"].value
-            
+        # Convert template to dict for YAML serialization
+        data = self.template.model_dump()
+        
+        # Convert all enum values to strings to avoid Python-specific tags
+        if "status_overrides" in data and data["status_overrides"]:
+            data["status_overrides"] = {
+                k: v.value if hasattr(v, 'value') else str(v)
+                for k, v in data["status_overrides"].items()
+            }
+        
+        # Convert condition types to strings
+        if "conditions" in data and data["conditions"]:
+            for condition in data["conditions"]:
+                if "type" in condition and hasattr(condition["type"], "value"):
+                    condition["type"] = condition["type"].value
+        
+        self._save_count += 1
+        return self._save_count, data
+    
+    def _write_template(self, save_number: int, data: dict[str, Any]) -> None:
+        """Write a template snapshot unless a newer one was already written."""
+        with self._save_lock:
+            if save_number < self._saved_number:
+                return
             # Save to file with safe dump to avoid Python-specific tags
             with open(self.template_path, "w") as f:
-                yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
-            
-            log("Auto-saved changes")
+                safe_dump(data, f, default_flow_style=False, sort_keys=False)
+            self._saved_number = save_number
+        log("Auto-saved changes")
+    
+    def _save_in_background(self, save_number: int, data: dict[str, Any]) -> None:
+        """Worker body for _auto_save; reports failures back on the UI thread."""
+        try:
+            self._write_template(save_number, data)
         except Exception as e:
             log(f"Failed to auto-save: {e}")
-            self.notify(f"Failed to auto-save: {e}", severity="error")
+            self.call_from_thread(self.notify, f"Failed to auto-save: {e}", severity="error")
     
     def action_save(self) -> None:
         """Manually save current state (kept for compatibility)."""
@@ -702,13 +1010,8 @@ class IssueTrackerApp(App):
 
     def action_cycle_sort(self) -> None:
         """Cycle through sort columns."""
-        # Get list of sort columns
-        sort_columns = list(SortColumn)
-        current_idx = sort_columns.index(self.current_sort)
-        
         # Move to next column
-        next_idx = (current_idx + 1) % len(sort_columns)
-        self.current_sort = sort_columns[next_idx]
+        self.current_sort = SORT_CYCLE[self.current_sort]
         
         # Default sort directions for each column
         if self.current_sort in [SortColumn.UPDATED, SortColumn.NUMBER]:
@@ -738,8 +1041,7 @@ class IssueTrackerApp(App):
             # Apply temporary filter changes
             self.template.state = data["state"]
             self.template.include_discussions = data["include_discussions"]
-            await self.refresh_issues()
-            self.update_display()
+            self.start_refresh()
             
         elif action == "save_as":
             # Save as new template
@@ -0,0 +1,21 @@
+"""YAML helpers that use the libyaml C loader and dumper when they are available."""
+
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+
+def safe_load(stream: Any) -> Any:
+    """Parse YAML like ``yaml.safe_load``, but with the C loader if possible."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data: Any, stream: Any = None, **kwargs: Any) -> Any:
+    """Serialize YAML like ``yaml.safe_dump``, but with the C dumper if possible."""
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
@@ -0,0 +1,201 @@
+"""Tests for GitHubClient's HTTP handling, run against httpx.MockTransport."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from github_issue_tracker import github_client
+from github_issue_tracker.github_client import GitHubClient, _issue_sort_key
+from github_issue_tracker.models import GitHubIssue, IssueStatus, QueryTemplate, Repository
+
+REPO = Repository(owner="octo", repo="tracker")
+
+
+def rest_issue(number: int, repo: str = "octo/tracker", updated: str = "2024-05-01T00:00:00Z") -> dict:
+    """A REST API issue item with the fields GitHubIssue needs."""
+    return {
+        "id": number * 10,
+        "number": number,
+        "title": f"Issue {number}",
+        "body": None,
+        "state": "open",
+        "html_url": f"https://github.com/{repo}/issues/{number}",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": updated,
+        "user": {"login": "octocat", "id": 1, "avatar_url": "", "html_url": ""},
+        "labels": [],
+        "repository_url": f"https://api.github.com/repos/{repo}",
+    }
+
+
+@pytest.fixture
+def make_client(tmp_path, monkeypatch):
+    """Build unauthenticated clients over a mock transport, caching under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    monkeypatch.setattr(github_client, "get_gh_token", lambda: None)
+    # Responses are kept in a module-level cache; start every test empty
+    monkeypatch.setattr(github_client, "_cache", github_client.TTLCache(maxsize=512, ttl=600))
+
+    def make(handler) -> GitHubClient:
+        return GitHubClient(transport=httpx.MockTransport(handler))
+
+    return make
+
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list[float]:
+    """Record the delays passed to asyncio.sleep and advance time.time instead of waiting."""
+    delays: list[float] = []
+    real_time = time.time
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(time, "time", lambda: real_time() + sum(delays))
+    return delays
+
+
+def test_unchanged_page_is_reused_after_304(make_client, monkeypatch):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == 'W/"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=[rest_issue(1), rest_issue(2)], headers={"ETag": 'W/"v1"'})
+
+    async def run() -> tuple[list, list]:
+        async with make_client(handler) as client:
+            first = await client.fetch_issues_async(REPO)
+            # An hour later: the since parameter moves on and the response cache is cold
+            monkeypatch.setattr(github_client, "_since_iso", lambda months: "2000-01-01T01:00:00Z")
+            monkeypatch.setattr(github_client, "_cache", github_client.TTLCache(maxsize=512, ttl=600))
+            second = await client.fetch_issues_async(REPO)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert [r.headers.get("If-None-Match") for r in requests] == [None, 'W/"v1"']
+    assert [i.number for i in second] == [i.number for i in first] == [1, 2]
+
+
+def test_spent_rate_limit_is_retried_after_reset(make_client, sleeps):
+    reset_at = int(time.time()) + 30
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            return httpx.Response(403, headers={
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(reset_at),
+            })
+        return httpx.Response(200, json=[rest_issue(1)])
+
+    async def run() -> list:
+        async with make_client(handler) as client:
+            return await client.fetch_issues_async(REPO)
+
+    issues = asyncio.run(run())
+
+    assert calls == 2
+    assert [i.number for i in issues] == [1]
+    # Waited until the reset before retrying
+    assert 29 <= sum(sleeps) <= 31
+
+
+def test_not_found_is_not_retried(make_client, sleeps):
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(404, json={"message": "Not Found"})
+
+    async def run() -> list:
+        async with make_client(handler) as client:
+            return await client.fetch_issues_async(REPO)
+
+    assert asyncio.run(run()) == []
+    assert calls == 1
+    assert sleeps == []
+
+
+def test_iter_issues_async_ends_with_the_complete_sorted_list(make_client):
+    repos = [Repository(owner="octo", repo=f"repo{n}") for n in range(3)]
+    template = QueryTemplate(name="Stream", repositories=repos, conditions=[])
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        repo = request.url.path.split("/")[3]
+        n = int(repo.removeprefix("repo"))
+        # Later repositories answer first
+        await asyncio.sleep(0.01 * (3 - n))
+        return httpx.Response(200, json=[
+            rest_issue(n * 10 + k, f"octo/{repo}", f"2024-05-0{k + 1}T00:00:00Z") for k in range(3)
+        ])
+
+    async def run() -> list[list]:
+        async with make_client(handler) as client:
+            return [issues async for issues in client.iter_issues_async(template, force_refresh=True)]
+
+    batches = asyncio.run(run())
+
+    assert [len(b) for b in batches] == [3, 6, 9]
+    for batch in batches:
+        assert batch == sorted(batch, key=_issue_sort_key)
+    assert sorted(i.number for i in batches[-1]) == [0, 1, 2, 10, 11, 12, 20, 21, 22]
+
+
+def test_force_refresh_bypasses_the_response_cache(make_client):
+    template = QueryTemplate(name="Forced", repositories=[REPO], conditions=[])
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json=[rest_issue(1)])
+
+    async def run() -> None:
+        async with make_client(handler) as client:
+            await client.fetch_all_issues_async(template)
+            await client.fetch_all_issues_async(template, force_refresh=True)
+
+    asyncio.run(run())
+
+    assert calls == 2
+
+
+def test_finalize_resets_fields_the_template_no_longer_sets(make_client):
+    template = QueryTemplate(name="Reset", repositories=[REPO], conditions=[])
+    issue = GitHubIssue.model_validate(rest_issue(1))
+    # Left over on a cached issue after the user un-ignored it and cleared its status and note
+    issue.is_ignored = True
+    issue.custom_status = IssueStatus.FUTURE
+    issue.custom_note = "old"
+
+    client = make_client(lambda request: httpx.Response(404))
+    [finalized] = client._finalize([issue], template)
+
+    assert not finalized.is_ignored
+    assert finalized.custom_status == IssueStatus.NONE
+    assert finalized.custom_note == ""
+
+
+def test_failed_page_keeps_the_other_pages(make_client, sleeps):
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        if page == 2:
+            return httpx.Response(404, json={"message": "Not Found"})
+        last = request.url.copy_set_param("page", 3)
+        return httpx.Response(200, json=[rest_issue(page)], headers={"Link": f'<{last}>; rel="last"'})
+
+    async def run() -> list:
+        async with make_client(handler) as client:
+            return await client.fetch_issues_async(REPO)
+
+    assert [i.number for i in asyncio.run(run())] == [1, 3]
@@ -3,47 +3,71 @@
 
 import asyncio
 import sys
+from pathlib import Path
 sys.path.insert(0, '.')
 
 from github_issue_tracker.tui import IssueTrackerApp
 from github_issue_tracker.models import QueryTemplate
-import yaml
+from github_issue_tracker.yaml_utils import safe_load
 
-async def test_startup():
-    """Test the app startup directly."""
+try:
+    import uvloop
+except ImportError:  # Optional, and not available on Windows
+    uvloop = None
+
+async def test_startup(force_refresh: bool = False):
+    """Test the app startup directly.
+
+    Issues are served from the disk cache when it is fresh; pass
+    ``--refresh`` to go to GitHub regardless. The report is written in one
+    go at the end, so terminal writes stay out of the timed steps.
+    """
+    report: list[str] = []
+    
     # Load template first
-    with open("templates/comfy-subgraph.yaml") as f:
-        data = yaml.safe_load(f)
+    raw = await asyncio.to_thread(Path("templates/comfy-subgraph.yaml").read_bytes)
+    data = safe_load(raw)
     template = QueryTemplate(**data)
-    print(f"Template loaded: {template.name}")
-    print(f"Conditions: {template.conditions}")
-    print(f"Logic: {template.condition_logic}")
+    report.append(f"Template loaded: {template.name}")
+    report.append(f"Conditions: {template.conditions}")
+    report.append(f"Logic: {template.condition_logic}")
     
     # Create app instance
-    app = IssueTrackerApp("templates/comfy-subgraph.yaml")
+    app = IssueTrackerApp("templates/comfy-subgraph.yaml", template=template)
     
     # Check initial state
-    print(f"\nInitial state:")
-    print(f"  issues: {len(app.issues)}")
-    print(f"  filtered_issues: {len(app.filtered_issues)}")
+    report.append("\nInitial state:")
+    report.append(f"  issues: {len(app.issues)}")
+    report.append(f"  filtered_issues: {len(app.filtered_issues)}")
     
-    # Try loading template
-    await app.load_template()
-    print(f"\nAfter load_template:")
-    print(f"  template: {app.template.name if app.template else 'None'}")
+    try:
+        # Try loading template (with the GitHub client set up alongside)
+        await app.load_and_prepare()
+        report.append("\nAfter load_template:")
+        report.append(f"  template: {app.template.name if app.template else 'None'}")
     
-    # Try refresh
-    print("\nCalling refresh_issues...")
-    await app.refresh_issues(force_refresh=True)
+        # Start the refresh in the background, as on_mount does, and only
+        # wait for it where the results are needed
+        report.append(f"\nStarting refresh (force_refresh={force_refresh})...")
+        refresh = app.start_refresh(force_refresh=force_refresh)
+        report.append(f"  refresh running: {not refresh.done()}")
+        await refresh
     
-    print(f"\nAfter refresh:")
-    print(f"  issues: {len(app.issues)}")
-    print(f"  filtered_issues: {len(app.filtered_issues)}")
+        report.append("\nAfter refresh:")
+        report.append(f"  issues: {len(app.issues)}")
+        report.append(f"  filtered_issues: {len(app.filtered_issues)}")
     
-    # Check if apply_filter was called
-    app.apply_filter()
-    print(f"\nAfter apply_filter:")
-    print(f"  filtered_issues: {len(app.filtered_issues)}")
+        # Check if apply_filter was called
+        app.apply_filter()
+        report.append("\nAfter apply_filter:")
+        report.append(f"  filtered_issues: {len(app.filtered_issues)}")
+    finally:
+        # The app keeps one GitHub client across refreshes
+        await app.close_client()
+        sys.stdout.write("\n".join(report) + "\n")
 
 if __name__ == "__main__":
-    asyncio.run(test_startup())
\ No newline at end of file
+    # Run on uvloop's libuv-based event loop when it is installed
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(test_startup(force_refresh="--refresh" in sys.argv[1:]))
\ No newline at end of file